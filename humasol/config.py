@@ -41,6 +41,10 @@ class AppConfig:
     SECRET_KEY: str
     SECURITY_PASSWORD_SALT: str
     DATABASE_URL: str
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_TIMEOUT: int = 30  # Seconds to wait for a free connection
+    DB_POOL_RECYCLE: int = 1800  # Seconds before a connection is replaced
 
     # Humasol #
     ADMIN_EMAIL: str
@@ -16,6 +16,7 @@ Period          -- Class containing information about the period during wich
 from __future__ import annotations
 
 import datetime
+import operator
 import re
 import typing as ty
 from datetime import date
@@ -32,6 +33,10 @@ from humasol.model import person, utils
 from humasol.model.snapshot import Snapshot
 from humasol.repository import db
 
+# Validation patterns, compiled once on import
+_FUNCTION_RE = re.compile(r"^[A-Z][A-Z\s,.]*")
+_NAME_RE = re.compile(r"^[A-Z][A-Z\s]*")
+
 
 class FollowupJob(model.BaseModel, model.ProjectElement):
     """Abstract base class for work related to project follow-up.
@@ -64,7 +69,10 @@ class FollowupJob(model.BaseModel, model.ProjectElement):
     def subscriber_id(self) -> SQLAlchemy.Column:
         """Provide subscriber ID database column."""
         return db.Column(
-            db.Integer, db.ForeignKey(person.Person.id), nullable=False
+            db.Integer,
+            db.ForeignKey(person.Person.id),
+            nullable=False,
+            index=True,
         )
 
     @declared_attr
@@ -76,7 +84,7 @@ class FollowupJob(model.BaseModel, model.ProjectElement):
     def project_id(self) -> SQLAlchemy.Column:
         """Provide project ID database column."""
         return db.Column(
-            db.Integer, db.ForeignKey("project.id"), nullable=False
+            db.Integer, db.ForeignKey("project.id"), nullable=False, index=True
         )
 
     @declared_attr
@@ -144,12 +152,9 @@ class FollowupJob(model.BaseModel, model.ProjectElement):
         if len(periods) == 0:
             return False
 
+        today = date.today()
         if any(
-            map(
-                lambda pe: not isinstance(pe, Period)
-                or pe.has_past(date.today()),
-                periods,
-            )
+            not isinstance(pe, Period) or pe.has_past(today) for pe in periods
         ):
             return False
 
@@ -213,9 +218,7 @@ class FollowupJob(model.BaseModel, model.ProjectElement):
         Return true if the subscriber should be notified. False otherwise.
         """
         return any(
-            map(
-                lambda p: p.should_update(self.last_notification), self.periods
-            )
+            p.should_update(self.last_notification) for p in self.periods
         )
 
     @Snapshot.protect
@@ -238,8 +241,8 @@ class FollowupJob(model.BaseModel, model.ProjectElement):
             self.periods = utils.merge_update_list(
                 self.periods,
                 params["periods"],
-                list(map(lambda d: d["start_date"], params["periods"])),
-                lambda p: p.start,
+                operator.itemgetter("start_date"),
+                operator.attrgetter("start"),
                 lambda p, d: p.update(d),
                 lambda d: Period(**d),
             )
@@ -353,7 +356,7 @@ class Task(FollowupJob):
         if not isinstance(function, str):
             return False
 
-        return re.fullmatch(r"^[A-Z][A-Z\s,.]*", function.upper()) is not None
+        return _FUNCTION_RE.fullmatch(function.upper()) is not None
 
     @staticmethod
     def is_legal_name(name: str) -> bool:
@@ -361,7 +364,7 @@ class Task(FollowupJob):
         if not isinstance(name, str):
             return False
 
-        return re.fullmatch(r"^[A-Z][A-Z\s]*", name.upper()) is not None
+        return _NAME_RE.fullmatch(name.upper()) is not None
 
     @Snapshot.protect
     def update(self, params: dict[str, ty.Any]) -> Task:
@@ -700,6 +703,6 @@ def construct_followup_work(
         params["subscriber"],
     )
 
-    params["periods"] = list(map(lambda p: Period(**p), params["periods"]))
+    params["periods"] = [Period(**p) for p in params["periods"]]
 
     return constructor(**params)
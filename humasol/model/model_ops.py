@@ -3,6 +3,7 @@
 All functions must be called from within an application context.
 """
 # Python Libraries
+import itertools
 import typing as ty
 
 import sqlalchemy
@@ -23,7 +24,7 @@ def _get_unique_attributes(
     obj: model.Model | ty.Iterable[model.Model],
 ) -> dict[str, ty.Any] | list[dict[str, ty.Any]]:
     """Retrieve all attributes of the object with a uniqueness constraint."""
-    if isinstance(obj, list):
+    if isinstance(obj, (list, tuple)):
         return [
             {
                 attr: getattr(ob, attr)
@@ -41,7 +42,7 @@ def _get_unique_attributes(
 
 
 def _merge_on_uniqueness(
-    new_objs: list[T], merge_identifier: ty.Callable[[T, T], None]
+    new_objs: ty.Sequence[T], merge_identifier: ty.Callable[[T, T], None]
 ) -> list[str]:
     cls = type(new_objs[0])
 
@@ -73,6 +74,43 @@ def archive_project(project_id: int) -> None:
     """
 
 
+def bulk_create_projects(rows: list[dict[str, ty.Any]]) -> list[int]:
+    """Insert many projects at once, bypassing the ORM.
+
+    Rows are checked and completed by Project.build_bulk_rows before anything
+    is written. All projects are then written with one statement, followed by
+    one statement for their SDGs.
+
+    Parameters
+    __________
+    rows    -- Column values of the projects to insert, see
+                Project.build_bulk_rows
+
+    Returns
+    _______
+    List of the identifiers of the inserted projects.
+    """
+    project_rows = model.Project.build_bulk_rows(rows)
+
+    project_ids = [
+        pk
+        for pk, in repo.bulk_insert(
+            model.Project, [values for values, _ in project_rows]
+        )
+    ]
+    repo.bulk_insert(
+        model.project_elements.ProjectSdg,
+        [
+            {"project_id": project_id, "sdg": sdg}
+            for project_id, (_, sdgs) in zip(project_ids, project_rows)
+            for sdg in sdgs
+        ],
+    )
+    repo.commit()
+
+    return project_ids
+
+
 def create_db_tables() -> None:
     """Create database tables for all the defined models."""
     db.create_all()
@@ -231,10 +269,10 @@ def edit_project(
     # Unify people
     people = {
         pers["email"]: pers
-        for pers in (
-            new_parameters["students"]
-            + new_parameters["supervisors"]
-            + new_parameters["partners"]
+        for pers in itertools.chain(
+            new_parameters["students"],
+            new_parameters["supervisors"],
+            new_parameters["partners"],
         )
     }
 
@@ -248,8 +286,8 @@ def edit_project(
 
     for job in jobs:
         # Unify subscribers with existing people
-        if job["subscriber"]["email"] in people:
-            job["subscriber"] = people[job["subscriber"]["email"]]
+        if subscriber := people.get(job["subscriber"]["email"]):
+            job["subscriber"] = subscriber
 
         # Translate unit string into model object
         for period in job["periods"]:
@@ -279,13 +317,21 @@ def get_my_associated_projects(user: model.User) -> list[model.Project]:
 
     A user is associated if they are listed under the people who collaborated.
     """
+    link = model.project_elements.ProjectPerson
+    role = model.project_elements.ProjectRole
+
     return model.Project.query.filter(
-        sqlalchemy.or_(
-            model.Project.students.any(model.Student.email == user.email),
-            model.Project.supervisors.any(
-                model.Supervisor.email == user.email
-            ),
-            model.Project.partners.any(model.Partner.email == user.email),
+        model.Project.team_links.any(
+            sqlalchemy.and_(
+                link.role.in_(
+                    [
+                        role.STUDENT.value,
+                        role.SUPERVISOR.value,
+                        role.PARTNER.value,
+                    ]
+                ),
+                link.person.has(model.Person.email == user.email),
+            )
         )
     ).all()
 
@@ -344,16 +390,26 @@ def get_my_tasks(user: model.User) -> list[model.Project]:
     ).all()
 
 
-def get_project(project_id: int, eager: bool = False) -> model.Project:
+def get_project(
+    project_id: int, eager: bool = False, full_graph: bool = False
+) -> model.Project:
     """Retrieve project with provided ID from the database.
 
     Parameters
     __________
     project_id  -- Project identifier in the database
+    eager       -- Whether to recursively load all related objects, for when
+                    the project will be detached from the session
+    full_graph  -- Whether to load the relationships shown with the project
+                    up front, for when the project will be rendered completely
     """
+    query = None
+    if full_graph:
+        query = model.Project.with_full_graph(model.Project.query)
+
     try:
         project = repo.get_object_by_id(
-            model.Project, project_id, eager  # type: ignore
+            model.Project, project_id, eager, query  # type: ignore
         )
     except exceptions.ObjectNotFoundException as exc:
         raise exceptions.ModelException(str(exc)) from exc
@@ -364,11 +420,15 @@ def get_project(project_id: int, eager: bool = False) -> model.Project:
 def get_projects() -> list[model.Project]:
     """Retrieve all projects from the database.
 
+    Only what is needed to list the projects is loaded up front.
+
     Returns
     _______
     Unsorted list of all projects.
     """
-    return model.Project.query.all()
+    return model.Project.query.options(
+        *model.Project.list_loader_options()
+    ).all()
 
 
 def get_users() -> list[model.User]:
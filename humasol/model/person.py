@@ -40,6 +40,22 @@ from humasol import exceptions, model
 from humasol.model.snapshot import Snapshot
 from humasol.repository import db
 
+# Validation patterns, compiled once on import
+_EMAIL_RE = re.compile(
+    r"^(?=[A-Z0-9][A-Z0-9@._%+-]{5,253}$)[A-Z0-9._%+-]{1,64}@"
+    r"(?:(?=[A-Z0-9-]{1,63}\.)[A-Z0-9]+"
+    r"(?:-[A-Z0-9]+)*\.){1,8}[A-Z]{2,63}$"
+)
+_FUNCTION_RE = re.compile(r"[A-Z]{2,}")
+_ILLEGAL_NAME_CHARS_RE = re.compile(r"[@_!#$%^&*()<>?/\\|}{~:]")
+_LETTERS_RE = re.compile(r"[A-Z]+")
+_LOGO_RE = re.compile(r"([A-Z_\-]+/)*[A-Z_\-]+\.[A-Z]{2,4}")
+_PHONE_RE = re.compile(r"^((\+|00)[1-9]{1,3}){0,1}[0-9]{9,12}")
+_SOUTHERN_COUNTRY_RE = re.compile(r"^[A-Z][A-Z\s.,]*")
+_STUDY_RE = re.compile(r"[A-Z.,\s]+")
+# Phone numbers with a leading 0 or 00 instead of +
+_PHONE_ZEROS_RE = re.compile(r"^[0]{1,2}.*")
+
 
 class Person(model.BaseModel, model.ProjectElement):
     """Abstract base class for a person working for/with Humasol.
@@ -79,7 +95,7 @@ class Person(model.BaseModel, model.ProjectElement):
     @declared_attr
     def organization(self) -> orm.RelationshipProperty:
         """Return database relationship object to Organization."""
-        return db.relationship("Organization", lazy="subquery")
+        return db.relationship("Organization", lazy="selectin")
 
     # End of database definitions #
 
@@ -135,8 +151,7 @@ class Person(model.BaseModel, model.ProjectElement):
         self.name = name
         self.email = email
 
-        phone_regex = r"^[0]{1,2}.*"
-        if phone is not None and re.match(phone_regex, phone):
+        if phone is not None and _PHONE_ZEROS_RE.match(phone):
             phone = "+" + phone.lstrip("0")
         self.phone = phone.replace(" ", "") if phone is not None else phone
 
@@ -152,12 +167,7 @@ class Person(model.BaseModel, model.ProjectElement):
         if not isinstance(email, str):
             return False
 
-        regex = (
-            r"^(?=[A-Z0-9][A-Z0-9@._%+-]{5,253}$)[A-Z0-9._%+-]{1,64}@"
-            r"(?:(?=[A-Z0-9-]{1,63}\.)[A-Z0-9]+"
-            r"(?:-[A-Z0-9]+)*\.){1,8}[A-Z]{2,63}$"
-        )
-        if not re.fullmatch(regex, email.upper()):
+        if not _EMAIL_RE.fullmatch(email.upper()):
             return False
 
         return True
@@ -171,8 +181,7 @@ class Person(model.BaseModel, model.ProjectElement):
         if len(name) == 0:
             return False
 
-        regex = re.compile(r"[@_!#$%^&*()<>?/\\|}{~:]")
-        if regex.search(name) is not None:
+        if _ILLEGAL_NAME_CHARS_RE.search(name) is not None:
             return False
 
         return True
@@ -195,8 +204,7 @@ class Person(model.BaseModel, model.ProjectElement):
             return False
 
         phone = phone.replace(" ", "")
-        regex = r"^((\+|00)[1-9]{1,3}){0,1}[0-9]{9,12}"
-        return re.fullmatch(regex, phone) is not None
+        return _PHONE_RE.fullmatch(phone) is not None
 
     @Snapshot.protect
     def update(self, params: dict[str, ty.Any]) -> Person:
@@ -258,7 +266,7 @@ class Student(Person):
     @declared_attr
     def organization(self) -> orm.RelationshipProperty:
         """Return database relationship object to Organization."""
-        return db.relationship("Organization", lazy="subquery")
+        return db.relationship("Organization", lazy="selectin")
 
     # End database definitions #
 
@@ -308,7 +316,7 @@ class Student(Person):
         if not isinstance(field, str):
             return False
 
-        return re.fullmatch(r"[A-Z.,\s]+", field.upper()) is not None
+        return _STUDY_RE.fullmatch(field.upper()) is not None
 
     @staticmethod
     def is_legal_university(university: str) -> bool:
@@ -316,7 +324,7 @@ class Student(Person):
         if not isinstance(university, str):
             return False
 
-        return re.fullmatch(r"[A-Z.,\s]+", university.upper()) is not None
+        return _STUDY_RE.fullmatch(university.upper()) is not None
 
     @Snapshot.protect
     def update(self, params: dict[str, ty.Any]) -> Student:
@@ -384,7 +392,7 @@ class Supervisor(Person):
     @declared_attr
     def organization(self) -> orm.RelationshipProperty:
         """Return database relationship object to Organization."""
-        return db.relationship("Organization", lazy="subquery")
+        return db.relationship("Organization", lazy="selectin")
 
     # End of database definitions #
 
@@ -419,7 +427,7 @@ class Supervisor(Person):
         if not isinstance(function, str):
             return False
 
-        return re.match("[A-Z]{2,}", function.upper()) is not None
+        return _FUNCTION_RE.match(function.upper()) is not None
 
     @Snapshot.protect
     def update(self, params: ty.Any) -> Supervisor:
@@ -486,7 +494,7 @@ class Partner(Person):
     @declared_attr
     def organization(self) -> orm.RelationshipProperty:
         """Return database relationship object to Organization."""
-        return db.relationship("Organization", lazy="subquery")
+        return db.relationship("Organization", lazy="selectin")
 
     # End of database definitions #
 
@@ -529,7 +537,7 @@ class Partner(Person):
         if not isinstance(function, str):
             return False
 
-        return re.match("[A-Z]{2,}", function.upper()) is not None
+        return _FUNCTION_RE.match(function.upper()) is not None
 
     def _construct_organization(
         self, partner_type: str, **kwargs: ty.Any
@@ -659,10 +667,7 @@ class Organization(model.BaseModel, model.ProjectElement):
         if not isinstance(logo, str):
             return False
 
-        return (
-            re.fullmatch(r"([A-Z_\-]+/)*[A-Z_\-]+\.[A-Z]{2,4}", logo.upper())
-            is not None
-        )
+        return _LOGO_RE.fullmatch(logo.upper()) is not None
 
     @staticmethod
     def is_legal_name(name: str) -> bool:
@@ -674,7 +679,7 @@ class Organization(model.BaseModel, model.ProjectElement):
             return False
 
         # TODO: add whitespaces and Ü type characters
-        return re.match(r"[A-Z]+", name.upper()) is not None
+        return _LETTERS_RE.match(name.upper()) is not None
 
     @Snapshot.protect
     def update(self, params: dict[str, ty.Any]) -> Organization:
@@ -772,7 +777,7 @@ class SouthernPartner(Organization):
         # TODO: Check from list
         return country is None or (
             isinstance(country, str)
-            and re.fullmatch(r"^[A-Z][A-Z\s.,]*", country.upper()) is not None
+            and _SOUTHERN_COUNTRY_RE.fullmatch(country.upper()) is not None
         )
 
     @Snapshot.protect
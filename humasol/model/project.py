@@ -13,81 +13,112 @@ EnergyProject -- Class representing projects with a focus on an electrical
 ProjectFactory -- Class providing static methods for project creation.
 ProjectCategory -- Enum class providing the defined project categories and
                     matching classes.
+ProjectType   -- Enum class with the database discriminators of the project
+                    classes.
 """
 
 # Python Libraries
 from __future__ import annotations
 
-import copy
+import collections
 import datetime
+import functools
+import operator
 import re
+import sys
+import time
 import typing as ty
 from abc import abstractmethod
-from enum import Enum
-from functools import reduce
+from enum import Enum, IntEnum
 
-from sqlalchemy import orm
+from sqlalchemy import inspect, orm
+from sqlalchemy.ext.associationproxy import association_proxy
 from sqlalchemy.orm import declared_attr
 
 # Local modules
 from humasol import exceptions, model
+from humasol import repository as repo
 from humasol.model import utils
 from humasol.model.snapshot import Snapshot
 from humasol.repository import db
 
 ExtraDatum = model.project_elements.ExtraDatum
+ProjectPerson = model.project_elements.ProjectPerson
+ProjectRole = model.project_elements.ProjectRole
+
+# Characters dropped from a project name when creating its code
+_CODE_SANITIZE_RE = re.compile(r'[,.$%&@#"]')
+# Separators between the words of a project name
+_NAME_SPLIT_RE = re.compile(r"[-\s]+")
+# Legal names and descriptions start with a letter
+_LETTERS_RE = re.compile(r"[A-Z]+")
+
+# Seconds for which the current date is reused by the date validators
+_TODAY_TTL = 60
+# Current date and the (monotonic) time at which it was read
+_today_cache: list[ty.Any] = [datetime.date.min, float("-inf")]
+
+# Identifier getters used to merge updated lists with the existing ones
+_EMAIL_ATTR = operator.attrgetter("email")
+_EMAIL_ITEM = operator.itemgetter("email")
+_NAME_ATTR = operator.attrgetter("name")
+_NAME_ITEM = operator.itemgetter("name")
+_SUBSCRIBER_NAME_ATTR = operator.attrgetter("subscriber.name")
+
+
+def _today() -> datetime.date:
+    """Provide the current date, re-reading it at most once per TTL.
+
+    The date can lag up to the TTL behind, so checks failing on it should be
+    repeated with a fresh date.
+    """
+    if (now := time.monotonic()) - _today_cache[1] > _TODAY_TTL:
+        _today_cache[:] = [datetime.date.today(), now]
+
+    return _today_cache[0]
+
+
+def _starts_with_letter(text: str) -> bool:
+    """Check whether the text starts with a letter."""
+    # Only the first character matters, do not upper case the whole text
+    return _LETTERS_RE.match(text[:1].upper()) is not None
+
+
+def _are_unique_and_legal(
+    items: ty.Iterable[ty.Any], guard: ty.Callable[[ty.Any], bool]
+) -> bool:
+    """Check in a single pass that all items pass the guard and are unique.
+
+    The guard is checked first, so illegal (possibly unhashable) items never
+    reach the set of seen items.
+    """
+    seen = set()
+    for item in items:
+        if not guard(item) or item in seen:
+            return False
+        seen.add(item)
 
+    return True
 
-# Relationship tables between database entities
-project_students = db.Table(
-    "project_student",
-    db.Column(
-        "project_id",
-        db.Integer,
-        db.ForeignKey("project.id", ondelete="CASCADE"),
-    ),
-    db.Column("student_id", db.Integer, db.ForeignKey("person.id")),
-)
-project_supers = db.Table(
-    "project_super",
-    db.Column(
-        "project_id",
-        db.Integer,
-        db.ForeignKey("project.id", ondelete="CASCADE"),
-    ),
-    db.Column("supervisor_id", db.Integer, db.ForeignKey("person.id")),
-)
-project_partners = db.Table(
-    "project_partners",
-    db.Column(
-        "project_id",
-        db.Integer,
-        db.ForeignKey("project.id", ondelete="CASCADE"),
-    ),
-    db.Column("partner_id", db.Integer, db.ForeignKey("person.id")),
-)
-project_contact = db.Table(
-    "project_contact",
-    db.Column(
-        "project_id",
-        db.Integer,
-        db.ForeignKey("project.id", ondelete="CASCADE"),
-    ),
-    db.Column("contact_id", db.Integer, db.ForeignKey("person.id")),
-)
-project_sdg_table = db.Table(
-    "project_sdg",
-    db.Column(
-        "project_id",
-        db.Integer,
-        db.ForeignKey("project.id", ondelete="CASCADE"),
-    ),
-    db.Column(
-        "sdg",
-        db.Enum(model.project_elements.SDG),
-        db.ForeignKey("sdg_db.sdg"),
-    ),
-)
+
+def _repr_list(items: ty.Iterable[ty.Any]) -> str:
+    """Represent the items as a list without building an intermediate one."""
+    return "[" + ", ".join(map(repr, items)) + "]"
+
+
+class ProjectType(IntEnum):
+    """Discriminator values used by the ORM to map projects to classes.
+
+    Stored as a small integer rather than the class name to keep the project
+    rows and the discriminator index narrow.
+    """
+
+    PROJECT = 0
+    AGRICULTURE = 1
+    ELECTRONICS_DEVELOPMENT = 2
+    ENERGY = 3
+    WATER = 4
+    WASTE_MANAGEMENT = 5
 
 
 # --------------------------
@@ -130,6 +161,8 @@ class Project(model.BaseModel):
     partners    -- Partners external to Humasol that contributed to the project
     contact_person  -- Person to contact in case there are questions about the
                         project
+    team_links  -- Role tagged links to the students, supervisors, partners
+                    and contact person
     subscriptions   -- List of subscription objects with people to update
     tasks       -- List of task objects with people to be reminded
     data_file   -- URI to the file containing folder of this project object
@@ -154,47 +187,44 @@ class Project(model.BaseModel):
     name = db.Column(db.String, index=True, nullable=False)
     creator = db.relationship("User", lazy=True)
     creator_id = db.Column(
-        db.Integer, db.ForeignKey(model.User.id)  # type: ignore
+        db.Integer, db.ForeignKey(model.User.id), index=True  # type: ignore
     )
     code = db.Column(db.String, index=True, unique=True, nullable=False)
     creation_date = db.Column(db.DateTime, index=True, nullable=False)
     implementation_date = db.Column(db.DateTime, index=True, nullable=False)
-    description = db.Column(db.Text, nullable=False)
+    # Only shown on the project page, not needed when listing projects
+    description = orm.deferred(db.Column(db.Text, nullable=False))
     category = db.Column(db.String, index=True, nullable=False)
-    type = db.Column(db.String(50))  # Used for internal mapping by SQLAlchemy
+    # Used for internal mapping by SQLAlchemy
+    type = db.Column(db.SmallInteger, index=True)
     location = db.relationship(
-        "Location", lazy=True, uselist=False, cascade="all, delete-orphan"
+        "Location", lazy="joined", uselist=False, cascade="all, delete-orphan"
     )
     work_folder = db.Column(db.String, unique=True, nullable=False)
     dashboard = db.Column(db.String)
     save_data = db.Column(db.Boolean, nullable=False)
     project_data = db.Column(db.String)
-    extra_data_db = db.relationship("ExtraDatum", cascade="all, delete-orphan")
-    sdgs_db = db.relationship(
-        "SdgDB",
-        secondary=project_sdg_table,
-        lazy="subquery",
-        backref=db.backref("projects", lazy=True),
+    # Read by init_on_load for every loaded project, so always batch it
+    extra_data_db = db.relationship(
+        "ExtraDatum", lazy="selectin", cascade="all, delete-orphan"
     )
-    data_source = db.relationship(
-        "DataSource", lazy=True, cascade="all", uselist=False
-    )
-    students = db.relationship(
-        "Student", secondary=project_students, lazy="subquery"
+    sdg_links = db.relationship(
+        "ProjectSdg", lazy=True, cascade="all, delete-orphan"
     )
-    supervisors = db.relationship(
-        "Supervisor", secondary=project_supers, lazy="subquery"
+    sdgs = association_proxy(
+        "sdg_links", "sdg", creator=model.project_elements.ProjectSdg
     )
-    partners = db.relationship(
-        "Partner", secondary=project_partners, lazy="subquery"
+    data_source = db.relationship(
+        "DataSource", lazy=True, cascade="all", uselist=False
     )
-    contact_person = db.relationship(
-        "Person", secondary=project_contact, lazy="subquery", uselist=False
+    # Students, supervisors, partners and contact person, see _get_team
+    team_links = db.relationship(
+        "ProjectPerson", lazy=True, cascade="all, delete-orphan"
     )
     subscriptions = db.relationship(
-        "Subscription", lazy=False, cascade="all, delete-orphan"
+        "Subscription", lazy=True, cascade="all, delete-orphan"
     )
-    tasks = db.relationship("Task", lazy=False, cascade="all, delete-orphan")
+    tasks = db.relationship("Task", lazy=True, cascade="all, delete-orphan")
     data_file = db.Column(db.String, unique=True, nullable=False)
 
     @declared_attr
@@ -206,7 +236,7 @@ class Project(model.BaseModel):
 
     __mapper_args__ = {
         "polymorphic_on": type,
-        "polymorphic_identity": "project",
+        "polymorphic_identity": ProjectType.PROJECT.value,
     }
 
     # End of database definitions #
@@ -296,117 +326,118 @@ class Project(model.BaseModel):
         subscriptions   -- List of subscription objects with people to update
         """
         # Parameter checks
-        if not Project.is_legal_name(name):
-            raise exceptions.IllegalArgumentException(
+        checks = (
+            (
+                Project.is_legal_name,
+                name,
                 "Parameter 'name' should be a non-empty string with "
-                "only letters"
-            )
-
-        if not Project.is_legal_creator(creator):
-            raise exceptions.IllegalArgumentException(
-                "Parameter 'creator' should be of type User"
-            )
-
-        if not Project.is_legal_creation_date(creation_date):
-            raise exceptions.IllegalArgumentException(
+                "only letters",
+            ),
+            (
+                Project.is_legal_creator,
+                creator,
+                "Parameter 'creator' should be of type User",
+            ),
+            (
+                Project.is_legal_creation_date,
+                creation_date,
                 "Parameter 'creation_date' should be of type datetime.date "
-                "and can only be as recent as the current day"
-            )
-
-        if not Project.is_legal_implementation_date(implementation_date):
-            raise exceptions.IllegalArgumentException(
+                "and can only be as recent as the current day",
+            ),
+            (
+                Project.is_legal_implementation_date,
+                implementation_date,
                 "Parameter 'implementation_date' has an illegal value. "
-                "Only projects up to this year can be implemented"
-            )
-
-        if not Project.is_legal_description(description):
-            raise exceptions.IllegalArgumentException(
+                "Only projects up to this year can be implemented",
+            ),
+            (
+                Project.is_legal_description,
+                description,
                 "Parameter 'description' has an illegal value. "
-                "Should contain at least 1 letter"
-            )
-
-        if not Project.is_legal_location(location):
-            raise exceptions.IllegalArgumentException(
-                "Parameter 'location' should not be None and of type Location"
-            )
-
-        if not Project.is_legal_work_folder(work_folder):
-            raise exceptions.IllegalArgumentException(
-                "Parameter 'work_folder' should be a non-empty string"
-            )
-
-        if not Project.are_legal_students(students):
-            raise exceptions.IllegalArgumentException(
+                "Should contain at least 1 letter",
+            ),
+            (
+                Project.is_legal_location,
+                location,
+                "Parameter 'location' should not be None and of type Location",
+            ),
+            (
+                Project.is_legal_work_folder,
+                work_folder,
+                "Parameter 'work_folder' should be a non-empty string",
+            ),
+            (
+                Project.are_legal_students,
+                students,
                 "Parameter 'students' should be a list containing 3 or 4 "
-                "unique students"
-            )
-
-        if not Project.are_legal_supervisors(supervisors):
-            raise exceptions.IllegalArgumentException(
+                "unique students",
+            ),
+            (
+                Project.are_legal_supervisors,
+                supervisors,
                 "Parameter 'supervisors' should be a list containing unique "
-                "supervisors"
-            )
-
-        if not Project.is_legal_contact_person(contact_person):
-            raise exceptions.IllegalArgumentException(
+                "supervisors",
+            ),
+            (
+                Project.is_legal_contact_person,
+                contact_person,
                 "Parameter 'contact_person' should not be None and of "
-                "type Person"
-            )
-
-        if not Project.are_legal_partners(partners):
-            raise exceptions.IllegalArgumentException(
+                "type Person",
+            ),
+            (
+                Project.are_legal_partners,
+                partners,
                 "Parameter 'partners' should be a list containing unique "
-                "partners"
-            )
-
-        if not Project.are_legal_sdgs(sdgs):
-            raise exceptions.IllegalArgumentException(
+                "partners",
+            ),
+            (
+                Project.are_legal_sdgs,
+                sdgs,
                 "Parameter 'sdgs' should be a non-empty list containing "
-                "unique SDGs"
-            )
-
-        if not Project.are_legal_tasks(tasks):
-            raise exceptions.IllegalArgumentException(
-                "Parameter 'tasks' should be a list containing unique tasks"
-            )
-
-        if not Project.is_legal_data_source(data_source):
-            raise exceptions.IllegalArgumentException(
+                "unique SDGs",
+            ),
+            (
+                Project.are_legal_tasks,
+                tasks,
+                "Parameter 'tasks' should be a list containing unique tasks",
+            ),
+            (
+                Project.is_legal_data_source,
+                data_source,
                 "Parameter 'data_source' should be None or of "
-                "type DataSource"
-            )
-
-        if not Project.is_legal_dashboard(dashboard):
-            raise exceptions.IllegalArgumentException(
-                "Parameter 'dashboard' should be of type str or None"
-            )
-
-        if not Project.is_legal_save_data_flag(save_data):
-            raise exceptions.IllegalArgumentException(
-                "Parameter 'save_data' should be of type bool"
-            )
-
-        if not Project.is_legal_data_folder(project_data):
-            raise exceptions.IllegalArgumentException(
-                "Parameter 'project_data' should be of type str or None"
-            )
-
-        if not Project.are_legal_subscriptions(subscriptions):
-            raise exceptions.IllegalArgumentException(
+                "type DataSource",
+            ),
+            (
+                Project.is_legal_dashboard,
+                dashboard,
+                "Parameter 'dashboard' should be of type str or None",
+            ),
+            (
+                Project.is_legal_save_data_flag,
+                save_data,
+                "Parameter 'save_data' should be of type bool",
+            ),
+            (
+                Project.is_legal_data_folder,
+                project_data,
+                "Parameter 'project_data' should be of type str or None",
+            ),
+            (
+                Project.are_legal_subscriptions,
+                subscriptions,
                 "Parameter 'subscriptions' should be None or a list "
-                "containing unique Subscriptions"
-            )
-
-        if not Project.are_legal_extra_data(extra_data):
-            raise exceptions.IllegalArgumentException(
+                "containing unique Subscriptions",
+            ),
+            (
+                Project.are_legal_extra_data,
+                extra_data,
                 "Parameter 'extra_data' should be a dictionary mapping "
-                "strings to strings"
-            )
-
-        if data_source is None:
-            pass
-        else:
-            pass
+                "strings to strings",
+            ),
+        )
+        for validator, value, message in checks:
+            if not validator(value):
+                raise exceptions.IllegalArgumentException(message)
 
         # All checks passed, instantiate object
 
@@ -425,13 +456,10 @@ class Project(model.BaseModel):
         self.partners = partners if partners is not None else []
         self.contact_person = contact_person
 
-        self.extra_data = dict[str, str | list[str]]()
-        self.extra_data_db = list[ExtraDatum]()
+        # Starts from the empty collection of a new instance
         self.set_extra_data(extra_data if extra_data is not None else {})
 
-        self.sdgs = list[model.SDG]()
-        self.sdgs_db = list[model.project_elements.SdgDB]()
-        self.set_sdgs(sdgs)
+        self._set_unchecked("sdgs", sdgs)
 
         self.data_source = data_source
         self.dashboard = dashboard
@@ -440,40 +468,109 @@ class Project(model.BaseModel):
         self.subscriptions = subscriptions if subscriptions is not None else []
         self.tasks = tasks if tasks is not None else []
 
-        self.project_components = list[model.ProjectComponent]()
+        self.project_components = []
 
         if self.code is None:
             self._create_code()
 
-        self.data_file = f"{self.code}.json"
+        self._set_unchecked("data_file", f"{self.code}.json")
         # TODO: generate project folder file
 
     # pylint: enable=too-many-statements, too-many-branches, too-many-locals
     # pylint: enable=too-many-arguments
 
+    # Properties #
+    @property
+    def contact_person(self) -> ty.Optional[model.person.Person]:
+        """Person to contact in case there are questions about the project."""
+        contacts = self._get_team(ProjectRole.CONTACT)
+        return contacts[0] if contacts else None
+
+    @contact_person.setter
+    def contact_person(
+        self, contact: ty.Optional[model.person.Person]
+    ) -> None:
+        self._set_team(
+            ProjectRole.CONTACT, [contact] if contact is not None else []
+        )
+
+    @property
+    def partners(self) -> tuple[model.person.Partner, ...]:
+        """Partners external to Humasol that contributed to the project.
+
+        Read-only view of the team links, assign a new list to change it.
+        """
+        return self._get_team(ProjectRole.PARTNER)  # type: ignore
+
+    @partners.setter
+    def partners(self, partners: list[model.person.Partner]) -> None:
+        self._set_team(ProjectRole.PARTNER, partners)
+
+    @property
+    def students(self) -> tuple[model.person.Student, ...]:
+        """Students that worked on the project.
+
+        Read-only view of the team links, assign a new list to change it.
+        """
+        return self._get_team(ProjectRole.STUDENT)  # type: ignore
+
+    @students.setter
+    def students(self, students: list[model.person.Student]) -> None:
+        self._set_team(ProjectRole.STUDENT, students)
+
+    @property
+    def supervisors(self) -> tuple[model.person.Supervisor, ...]:
+        """Humasol members that guided the student team.
+
+        Read-only view of the team links, assign a new list to change it.
+        """
+        return self._get_team(ProjectRole.SUPERVISOR)  # type: ignore
+
+    @supervisors.setter
+    def supervisors(self, supervisors: list[model.person.Supervisor]) -> None:
+        self._set_team(ProjectRole.SUPERVISOR, supervisors)
+
     # Magic methods #
     def __repr__(self) -> str:
-        """Provide a string representation for this instance."""
-        return (
-            f"name={self.name}, "
-            f"date={self.implementation_date}, "
-            f"description={self.description}, "
-            f"category={self.category}, "
-            f"location={repr(self.location)}, "
-            f"work_folder={self.work_folder}, "
-            f"students={repr([repr(s) for s in self.students])}, "
-            f"supervisors={repr([repr(s) for s in self.supervisors])}, "
-            f"partners={repr([repr(p) for p in self.partners])}, "
-            f"code={self.code}, "
-            f"sdgs={repr([repr(sdg) for sdg in self.sdgs])}, "
-            f"tasks={repr([repr(t) for t in self.tasks])}, "
-            f"data_source={repr(self.data_source)}, "
-            f"dashboard={self.dashboard}, "
-            f"save_data={self.save_data}, "
-            f"project_data={self.project_data}, "
-            f"extra_data={repr(self.extra_data)}, "
-            f"subscriptions={repr([repr(s) for s in self.subscriptions])}"
-        )
+        """Provide a string representation for this instance.
+
+        Attributes that have not been loaded from the database are shown as
+        <unloaded>, so representing a project never issues queries.
+        """
+        unloaded = inspect(self).unloaded
+
+        def show(attr: str, fmt: ty.Callable[[ty.Any], str] = str) -> str:
+            """Format the attribute if it is loaded."""
+            if attr in unloaded:
+                return "<unloaded>"
+            return fmt(getattr(self, attr))
+
+        def team(attr: str) -> str:
+            """Format a team list, only called once the team is loaded."""
+            return _repr_list(getattr(self, attr))
+
+        parts = [
+            f"name={show('name')}",
+            f"date={show('implementation_date')}",
+            f"description={show('description')}",
+            f"category={show('category')}",
+            f"location={show('location', repr)}",
+            f"work_folder={show('work_folder')}",
+            f"students={show('team_links', lambda _: team('students'))}",
+            f"supervisors={show('team_links', lambda _: team('supervisors'))}",
+            f"partners={show('team_links', lambda _: team('partners'))}",
+            f"code={show('code')}",
+            "sdgs="
+            + show("sdg_links", lambda lks: _repr_list(lk.sdg for lk in lks)),
+            f"tasks={show('tasks', _repr_list)}",
+            f"data_source={show('data_source', repr)}",
+            f"dashboard={show('dashboard')}",
+            f"save_data={show('save_data')}",
+            f"project_data={show('project_data')}",
+            f"extra_data={self.extra_data!r}",
+            f"subscriptions={show('subscriptions', _repr_list)}",
+        ]
+        return ", ".join(parts)
 
     def __setattr__(self, key, value) -> None:
         """Set the attribute of this object.
@@ -490,28 +587,41 @@ class Project(model.BaseModel):
         utils.check_guards(self, key, value)
         super().__setattr__(key, value)
 
+    def _set_unchecked(self, key: str, value: ty.Any) -> None:
+        """Set the attribute of this object without checking its guards.
+
+        Only for values that were already validated or are derived from
+        validated attributes or stored rows.
+        """
+        super().__setattr__(key, value)
+
     # Static methods #
     # Validators #
     @staticmethod
     def are_legal_extra_data(data: ty.Optional[dict[str, str]]) -> bool:
         """Check whether the provided extra folder has a legal format."""
-        return (
-            data is None
-            or isinstance(data, dict)
-            and all(  # For all items:
-                map(
-                    lambda t: isinstance(t[0], str)  # Key is a string
-                    and (
-                        isinstance(t[1], str)  # Value is a string
-                        or (  # Or list of strings
-                            isinstance(t[1], list)
-                            and all(map(lambda e: isinstance(e, str), t[1]))
-                        )
-                    ),
-                    data.items(),
-                )
-            )
-        )
+        if data is None:
+            return True
+
+        if not isinstance(data, dict):
+            return False
+
+        for key, value in data.items():
+            # Keys are strings, values are strings or lists of strings
+            if not isinstance(key, str):
+                return False
+
+            if isinstance(value, str):
+                continue
+
+            if not isinstance(value, list):
+                return False
+
+            for elem in value:
+                if not isinstance(elem, str):
+                    return False
+
+        return True
 
     @staticmethod
     def are_legal_partners(partners: list[model.person.Partner]) -> bool:
@@ -519,8 +629,7 @@ class Project(model.BaseModel):
         return (
             isinstance(partners, (list, tuple))
             and len(partners) > 0
-            and all(map(Project.is_legal_partner, partners))
-            and len(partners) == len(set(partners))
+            and _are_unique_and_legal(partners, Project.is_legal_partner)
         )
 
     @staticmethod
@@ -547,8 +656,7 @@ class Project(model.BaseModel):
         return (
             isinstance(students, (list, tuple))
             and (Project.MIN_STUDENTS <= len(students) <= Project.MAX_STUDENTS)
-            and all(map(Project.is_legal_student, students))
-            and len(students) == len(set(students))
+            and _are_unique_and_legal(students, Project.is_legal_student)
         )
 
     @staticmethod
@@ -558,17 +666,16 @@ class Project(model.BaseModel):
         """Check whether the provided list is a legal subscriptions list."""
         return subscriptions is None or (
             isinstance(subscriptions, (list, tuple))
-            and all(map(Project.is_legal_subscription, subscriptions))
-            and len(subscriptions) == len(set(subscriptions))
+            and _are_unique_and_legal(
+                subscriptions, Project.is_legal_subscription
+            )
         )
 
     @staticmethod
     def are_legal_supervisors(supers: list[model.person.Supervisor]) -> bool:
         """Check whether the provided list is a legal supervisor list."""
-        return (
-            isinstance(supers, (list, tuple))
-            and all(map(Project.is_legal_supervisor, supers))
-            and len(supers) == len(set(supers))
+        return isinstance(supers, (list, tuple)) and _are_unique_and_legal(
+            supers, Project.is_legal_supervisor
         )
 
     @staticmethod
@@ -578,8 +685,7 @@ class Project(model.BaseModel):
         """Check whether the provided list is a legal tasks list."""
         return tasks is None or (
             isinstance(tasks, list)
-            and all(map(Project.is_legal_task, tasks))
-            and len(tasks) == len(set(tasks))
+            and _are_unique_and_legal(tasks, Project.is_legal_task)
         )
 
     @staticmethod
@@ -590,8 +696,9 @@ class Project(model.BaseModel):
     @staticmethod
     def is_legal_creation_date(date: datetime.date) -> bool:
         """Check whether the provided date is a legal creation date."""
-        return (
-            isinstance(date, datetime.date) and date <= datetime.date.today()
+        # The cached date may lag behind around midnight, re-read it then
+        return isinstance(date, datetime.date) and (
+            date <= _today() or date <= datetime.date.today()
         )
 
     @staticmethod
@@ -624,17 +731,17 @@ class Project(model.BaseModel):
     def is_legal_description(description: str) -> bool:
         """Check whether the provided description has no illegal characters."""
         # TODO: Correct regex
-        return (
-            isinstance(description, str)
-            and re.match(r"[A-Z]+", description.upper()) is not None
+        return isinstance(description, str) and _starts_with_letter(
+            description
         )
 
     @staticmethod
     def is_legal_implementation_date(date: datetime.date) -> bool:
         """Check whether the provided date is legal as implementation date."""
-        return (
-            isinstance(date, datetime.date)
-            and date.year <= datetime.date.today().year
+        # The cached date may lag behind around new year, re-read it then
+        return isinstance(date, datetime.date) and (
+            date.year <= _today().year
+            or date.year <= datetime.date.today().year
         )
 
     @staticmethod
@@ -646,10 +753,7 @@ class Project(model.BaseModel):
     def is_legal_name(name: str) -> bool:
         """Check whether the provided name contains legal characters."""
         # TODO: Correct regex
-        return (
-            isinstance(name, str)
-            and re.match(r"[A-Z]+", name.upper()) is not None
-        )
+        return isinstance(name, str) and _starts_with_letter(name)
 
     @staticmethod
     def is_legal_partner(partner: model.person.Partner) -> bool:
@@ -661,7 +765,9 @@ class Project(model.BaseModel):
         component: model.project_components.ProjectComponent,
     ) -> bool:
         """Check if the provided component is a legal project component."""
-        return isinstance(component, model.project_components.ProjectComponent)
+        return type(component) in utils.get_subclasses(
+            model.project_components.ProjectComponent
+        )
 
     @staticmethod
     def is_legal_save_data_flag(flag: bool) -> bool:
@@ -701,30 +807,55 @@ class Project(model.BaseModel):
 
     # Private methods #
 
+    @staticmethod
+    def _code_from_name(name: str) -> str:
+        """Provide a short letter code based on the provided name."""
+        name_pieces = _NAME_SPLIT_RE.split(_CODE_SANITIZE_RE.sub("", name))
+
+        return "".join(piece[0] for piece in name_pieces if piece)
+
     def _create_code(self) -> None:
         """Create a short letter code based on the project name."""
-        name_pieces = (
-            re.sub(r'[,.$%&@#"]', "", self.name)
-            .replace("-", " ")
-            .split(sep=" ")
-        )
-
-        self.code = reduce(
-            lambda x, y: x + y, map(lambda s: s[0], name_pieces)
-        )
+        self._set_unchecked("code", Project._code_from_name(self.name))
 
     def _filter_project_components(
         self, component_type: ty.Type[T]
     ) -> list[T]:
         """Retrieve Project components of the specified type."""
-        return list(
-            filter(
-                lambda c: isinstance(c, component_type),  # type: ignore
-                self.project_components,
-            )
+        component_types = utils.get_subclasses(component_type)
+        return [
+            c
+            for c in self.project_components
+            if type(c) in component_types  # type: ignore
+        ]
+
+    def _get_team(self, role: ProjectRole) -> tuple[model.person.Person, ...]:
+        """Provide the people linked to this project with the given role.
+
+        The people are collected from the team links, so the result is a
+        tuple. Changes to it could not be written back to the links.
+        """
+        return tuple(
+            link.person for link in self.team_links if link.role == role
         )
 
-    # pylint: disable=too-many-branches
+    def _set_team(
+        self, role: ProjectRole, people: ty.Iterable[model.person.Person]
+    ) -> None:
+        """Replace the people linked to this project with the given role.
+
+        Links of people keeping their role are reused, so their rows are not
+        deleted and inserted again.
+        """
+        kept = {
+            id(link.person): link
+            for link in self.team_links
+            if link.role == role
+        }
+        self.team_links = [
+            link for link in self.team_links if link.role != role
+        ] + [kept.get(id(per)) or ProjectPerson(per, role) for per in people]
+
     def _update_general(self, params: ProjectArgs) -> None:
         """Update the general attributes of this project.
 
@@ -735,59 +866,125 @@ class Project(model.BaseModel):
         between a value that is None and a value that is not present to update
         (without assigning arbitrary 'not-present' values to parameters).
         """
-        # Tried to remove branches with loops over variables,
-        # but TypedDict requires string literals as keys...
+        for key, value in params.items():
+            if handler := Project._GENERAL_HANDLERS.get(key):
+                handler(self, value)
+
+        self._update_team(params)
+
+    def _update_team(self, params: ProjectArgs) -> None:
+        """Update the students, supervisors, partners and contact person."""
+        team_lists = [
+            (attr, const, params[attr])  # type: ignore
+            for attr, const in (
+                ("students", model.Student),
+                ("supervisors", model.Supervisor),
+                ("partners", model.Partner),
+            )
+            if attr in params
+        ]
+
+        if "contact_person" in params:
+            self.contact_person.update(params["contact_person"])
 
-        if "name" in params:
-            self.name = params["name"]
+        # People joining the team may already be stored for other projects
+        stored = self._fetch_stored_people(
+            {
+                per_params["email"]
+                for _, _, new_list in team_lists
+                for per_params in new_list
+            }
+        )
 
-        if "implementation_date" in params:
-            self.implementation_date = params["implementation_date"]
+        for attr, const, new_list in team_lists:
+            self._merge_people(attr, new_list, const, stored)
 
-        if "description" in params:
-            self.description = params["description"]
+    def _fetch_stored_people(
+        self, emails: set[str]
+    ) -> dict[str, model.person.Person]:
+        """Retrieve the stored people with the provided emails at once.
 
-        if "work_folder" in params:
-            self.work_folder = params["work_folder"]
+        Members of the current team are not fetched again. Projects that were
+        never stored are built without a database, so nothing is fetched.
+        """
+        if not emails or not inspect(self).has_identity:
+            return {}
 
-        if "sdgs" in params:
-            self.set_sdgs([model.SDG.from_str(s) for s in params["sdgs"]])
+        emails -= {link.person.email for link in self.team_links}
 
-        if "extra_data" in params and params["extra_data"]:
-            self.set_extra_data(params["extra_data"])
+        return {
+            per.email: per
+            for per in repo.get_objects_by_values(
+                model.person.Person, "email", emails
+            )
+        }
 
-        if "location" in params:
-            self.location.update(params["location"])
+    def _merge_people(
+        self,
+        attr: str,
+        new_list: list[dict[str, ty.Any]],
+        const: type,
+        stored: dict[str, model.person.Person],
+    ) -> None:
+        """Merge the team list stored under attr with the new parameters.
 
-        if "contact_person" in params:
-            self.contact_person.update(params["contact_person"])
+        New members are taken from the stored people if their email matches
+        one of the right type, only unknown people are constructed.
+        """
 
-        def merge_person_list(old_list, new_list, const):
-            """Merge list of objects and dictionaries."""
-            return utils.merge_update_list(
-                old_list,
+        def construct(per_params: dict[str, ty.Any]) -> model.person.Person:
+            """Reuse a stored person or construct a new one."""
+            if isinstance(person := stored.get(per_params["email"]), const):
+                return person.update(per_params)
+            return const(**per_params)
+
+        setattr(
+            self,
+            attr,
+            utils.merge_update_list(
+                getattr(self, attr),
                 new_list,
-                [o["email"] for o in new_list],
-                lambda p: p.email,
+                _EMAIL_ITEM,
+                _EMAIL_ATTR,
                 lambda p, d: p.update(d),
-                lambda d: const(**d),
-            )
-
-        if "students" in params:
-            self.students = merge_person_list(
-                self.students, params["students"], model.Student
-            )
+                construct,
+            ),
+        )
 
-        if "supervisors" in params:
-            self.supervisors = merge_person_list(
-                self.supervisors, params["supervisors"], model.Supervisor
-            )
+    # Handlers for the general update parameters, keyed by parameter name
+    _GENERAL_HANDLERS: ty.ClassVar[
+        dict[str, ty.Callable[[Project, ty.Any], None]]
+    ] = {
+        "name": lambda self, v: setattr(self, "name", v),
+        "implementation_date": lambda self, v: setattr(
+            self, "implementation_date", v
+        ),
+        "description": lambda self, v: setattr(self, "description", v),
+        "work_folder": lambda self, v: setattr(self, "work_folder", v),
+        "sdgs": lambda self, v: self.set_sdgs(
+            [model.SDG.from_str(s) for s in v]
+        ),
+        "extra_data": lambda self, v: v and self.set_extra_data(v),
+        "location": lambda self, v: self.location.update(v),
+    }
 
-        if "partners" in params:
-            self.partners = merge_person_list(
-                self.partners, params["partners"], model.Partner
-            )
+    # All parameters handled by update, others are ignored
+    _UPDATE_KEYS: ty.ClassVar[frozenset[str]] = frozenset(
+        {
+            *_GENERAL_HANDLERS,
+            "students",
+            "supervisors",
+            "partners",
+            "contact_person",
+            "tasks",
+            "data_source",
+            "subscriptions",
+            "dashboard",
+            "save_data",
+        }
+    )
 
+    # pylint: disable=too-many-branches
     def _update_followup(self, params: ProjectArgs) -> None:
         """Update the follow-up attributes of this project."""
         construct_fw = model.followup_work.construct_followup_work
@@ -797,56 +994,193 @@ class Project(model.BaseModel):
                 self.tasks = model.utils.merge_update_list(
                     self.tasks,
                     new_tasks,
-                    list(map(lambda d: d["name"], new_tasks)),
-                    lambda ta: ta.name,
-                    lambda ta, dic: ta.update(dic),
-                    lambda dic: construct_fw(model.followup_work.Task, dic),
+                    _NAME_ITEM,
+                    _NAME_ATTR,
+                    model.followup_work.Task.update,
+                    functools.partial(construct_fw, model.followup_work.Task),
                 )
             else:
                 self.set_tasks([])
 
         if "data_source" in params:
-            if params["data_source"] is None:
+            if (source_params := params["data_source"]) is None:
                 self.data_source = None
                 self.set_subscriptions([])
                 self.dashboard = None
                 self.save_data = False
+                return
+
+            if (data_source := self.data_source) is not None:
+                data_source.update(source_params)
             else:
-                if self.data_source is not None:
-                    self.data_source.update(params["data_source"])
-                else:
-                    self.set_data_source(
-                        self.build_data_source(params["data_source"])
-                    )
+                self.set_data_source(self.build_data_source(source_params))
+
+        elif self.data_source is None:
+            # Remaining attributes only apply to projects with a data source
+            return
+
+        if "subscriptions" in params:
+            if new_subs := params["subscriptions"]:
+                self.subscriptions = model.utils.merge_update_list(
+                    self.subscriptions,
+                    new_subs,
+                    lambda dic: dic["subscriber"]["name"],
+                    _SUBSCRIBER_NAME_ATTR,
+                    model.followup_work.Subscription.update,
+                    functools.partial(
+                        construct_fw, model.followup_work.Subscription
+                    ),
+                )
+            else:
+                self.subscriptions = []
 
-        if self.data_source is not None:
-            if "subscriptions" in params:
-                if new_subs := params["subscriptions"]:
-                    self.subscriptions = model.utils.merge_update_list(
-                        self.subscriptions,
-                        new_subs,
-                        list(
-                            map(
-                                lambda dic: dic["subscriber"]["name"],
-                                new_subs,
-                            )
-                        ),
-                        lambda sub: sub.subscriber.name,
-                        lambda sub, dic: sub.update(**dic),
-                        lambda dic: construct_fw(
-                            model.followup_work.Subscription, dic
-                        ),
-                    )
-                else:
-                    self.subscriptions = list[model.Subscription]()
-            if "dashboard" in params:
-                self.dashboard = params["dashboard"]
-            if "save_data" in params:
-                self.set_save_data(params["save_data"])
+        if "dashboard" in params:
+            self.dashboard = params["dashboard"]
+
+        if "save_data" in params:
+            self.set_save_data(params["save_data"])
 
     # pylint: enable=too-many-branches
 
     # Public methods #
+    @classmethod
+    def build_bulk_rows(
+        cls, rows: list[dict[str, ty.Any]]
+    ) -> list[tuple[dict[str, ty.Any], list[model.SDG]]]:
+        """Check and complete project rows to be inserted in bulk.
+
+        Intended for imports, where constructing every project through the
+        ORM is too costly. Every row is checked with the same guards as the
+        constructor and completed with the derived columns (code, data file,
+        discriminator). Only the project columns and the SDGs are covered,
+        related objects (location, people, follow-up work) have to be added
+        afterwards through the regular update path.
+
+        Parameters
+        __________
+        rows    -- Column values of the projects to insert. The entries
+                    'category', 'creator' and 'sdgs' should hold a
+                    ProjectCategory, a User and a list of SDGs respectively
+
+        Returns
+        _______
+        List with the column values and the SDGs of every project.
+        """
+        project_rows: list[tuple[dict[str, ty.Any], list[model.SDG]]] = []
+
+        for row in rows:
+            values = dict(row)
+            category = values.pop("category")
+            creator = values.pop("creator")
+            sdgs = values.pop("sdgs")
+
+            if not Project.is_legal_creator(creator):
+                raise exceptions.IllegalArgumentException(
+                    "Parameter 'creator' should be of type User"
+                )
+
+            if not Project.are_legal_sdgs(sdgs):
+                raise exceptions.IllegalArgumentException(
+                    "Parameter 'sdgs' should be a non-empty list containing "
+                    "unique SDGs"
+                )
+
+            mapper = orm.class_mapper(category.class_name)
+            for key, value in values.items():
+                if key not in mapper.columns:
+                    raise exceptions.IllegalArgumentException(
+                        f"Unknown project attribute: {key}"
+                    )
+                utils.check_guards(category.class_name, key, value)
+
+            if values.get("code") is None:
+                values["code"] = Project._code_from_name(values["name"])
+
+            values.setdefault("save_data", False)
+            values |= {
+                "creator_id": creator.id,
+                "category": category.name,
+                "type": mapper.polymorphic_identity,
+                "data_file": f"{values['code']}.json",
+            }
+
+            project_rows.append((values, sdgs))
+
+        return project_rows
+
+    @classmethod
+    def with_full_graph(cls, query: orm.Query) -> orm.Query:
+        """Eagerly load the relationships needed to render whole projects.
+
+        The collections are loaded lazily by default, so fetching a project
+        only queries what is used. Queries whose projects are rendered
+        completely should be adjusted with this method, which loads every
+        relationship shown with a project up front, with one additional
+        query per collection instead of one per project. The deferred
+        description is loaded along with the other columns.
+
+        Only the relationships of the projects themselves and of their
+        location are covered. Projects that are detached from the session
+        should be loaded recursively instead.
+
+        Parameters
+        __________
+        query   -- Query selecting projects
+        """
+        location = orm.joinedload(cls.location)
+
+        return query.options(
+            location.joinedload(model.project_elements.Location.address),
+            location.joinedload(model.project_elements.Location.coordinates),
+            orm.joinedload(cls.creator),
+            orm.joinedload(cls.data_source),
+            orm.selectinload(cls.team_links),
+            orm.selectinload(cls.sdg_links),
+            orm.selectinload(cls.subscriptions),
+            orm.selectinload(cls.tasks),
+            orm.selectinload(cls.extra_data_db),
+            orm.undefer(cls.description),
+        )
+
+    @classmethod
+    def list_loader_options(cls) -> list[orm.interfaces.LoaderOption]:
+        """Provide the loader options for queries listing projects.
+
+        Listings only show the name, country and implementation year of each
+        project. Only those columns are loaded, together with the address of
+        the location in the same query.
+        """
+        return [
+            orm.load_only(cls.name, cls.category, cls.implementation_date),
+            orm.joinedload(cls.location).joinedload(
+                model.project_elements.Location.address
+            ),
+        ]
+
+    @classmethod
+    def iter_readonly(
+        cls, query: orm.Query, batch_size: int = 100
+    ) -> ty.Iterator[Project]:
+        """Iterate over the projects of a query without keeping them around.
+
+        Projects are fetched in batches and removed from the session after
+        they have been handled, so memory stays bounded by the batch size
+        instead of growing with the number of projects. Handled projects are
+        detached: changes to them are not saved and attributes that were not
+        loaded can no longer be accessed.
+
+        Parameters
+        __________
+        query       -- Query selecting projects
+        batch_size  -- Number of projects fetched from the database at once
+        """
+        for project in query.yield_per(batch_size):
+            try:
+                yield project
+            finally:
+                # Also when the caller stops early and the iterator is closed
+                db.session.expunge(project)
+
     def add_component(
         self, component: model.project_components.ProjectComponent
     ) -> None:
@@ -870,154 +1204,85 @@ class Project(model.BaseModel):
     @orm.reconstructor  # Function is called by the ORM on database load
     def init_on_load(self) -> None:
         """Prepare instance when it is loaded from the database."""
-        self.sdgs = [s.sdg for s in self.sdgs_db]
-
-        extra_data = dict[str, str | list[str]]()
+        grouped: collections.defaultdict[
+            str, list[str]
+        ] = collections.defaultdict(list)
         for ext_d in self.extra_data_db:
-            if ext_d.key in extra_data:
-                if isinstance(extra_data[ext_d.key], list):
-                    extra_data[ext_d.key].append(ext_d.value)  # type: ignore
-                else:
-                    extra_data[ext_d.key] = [
-                        extra_data[ext_d.key],  # type: ignore
-                        ext_d.value,
-                    ]
-            else:
-                extra_data[ext_d.key] = ext_d.value
-        self.extra_data = extra_data
+            # Loaded keys are new strings, share them like new rows do
+            grouped[sys.intern(ext_d.key)].append(ext_d.value)
+
+        # Keys stored only once hold a single value
+        extra_data: dict[str, str | list[str]] = {
+            key: values[0] if len(values) == 1 else values
+            for key, values in grouped.items()
+        }
+        self._set_unchecked("extra_data", extra_data)
 
     def set_sdgs(self, sdgs: list[model.project_elements.SDG]) -> None:
         """Set the list of SDGs for this project."""
         self.sdgs = sdgs if sdgs else []
-        self.sdgs_db = [model.project_elements.SdgDB(sdg) for sdg in self.sdgs]
 
     def set_extra_data(self, data: dict[str, str | list[str]]) -> None:
         """Set the extra folder for this project.
 
         Extra data can be used to configure project managers.
         """
-        self.extra_data = copy.deepcopy(data)
+        # Values are strings or lists of strings, only the lists need copying
+        self.extra_data = {
+            key: list(value) if isinstance(value, list) else value
+            for key, value in data.items()
+        }
 
         # Merge with existing data (modify database as little as possible)
-        extra_data_db: dict[str, ExtraDatum | list[ExtraDatum]] = {}
+        unmatched: collections.defaultdict[
+            tuple[str, str], list[ExtraDatum]
+        ] = collections.defaultdict(list)
         for ext_d in self.extra_data_db:
-            if ext_d.key in extra_data_db:
-                if isinstance(extra_data_db[ext_d.key], list):
-                    extra_data_db[ext_d.key].append(ext_d)
-                else:
-                    extra_data_db[ext_d.key] = [
-                        extra_data_db[ext_d.key],  # type: ignore
-                        ext_d,
-                    ]
-            else:
-                extra_data_db[ext_d.key] = ext_d
+            unmatched[(ext_d.key, ext_d.value)].append(ext_d)
 
         new_extra_data_db = []
+        missing: list[tuple[str, str]] = []
 
-        def merge_lists(
-            dkey: str, dval: list[str], db_val: list[ExtraDatum]
-        ) -> None:
-            """Merge new and old lists of extra data under the same key.
-
-            Merge the new list of extra data with key 'dkey' and old list of db
-            wrappers with key 'dkey'.
-            Reuses as many rapper objects as possible by just modifying their
-            value.
-            """
-            looper = iter(db_val)  # Create iterator to burn used elements
-            missed = []  # Container for burnt but unused elements
-
-            # Loop through old wrappers
-            for item in looper:
-                if item.value in dval:
-                    # Same value in old and new lists -> just keep
-                    dval.remove(item.value)
-                    new_extra_data_db.append(item)
+        # Rows that already hold a wanted pair are kept untouched
+        for key, value in self.extra_data.items():
+            for val in value if isinstance(value, list) else [value]:
+                if wrappers := unmatched.get((key, val)):
+                    new_extra_data_db.append(wrappers.pop())
                 else:
-                    # Old value not in the new list -> hold to reuse wrapper
-                    missed.append(item)
-                if len(dval) == 0:
-                    break
-            else:
-                # Only executes if there are still new values that haven't
-                # been processed
-
-                # Join existing but unused ExtraData wrapper objects
-                remainder = list(looper) + missed
-
-                # Loop through remaining new elements in list
-                for elem in dval:
-                    if len(remainder) > 0:
-                        # There are still unused wrapper objects -> use them
-                        new_el = remainder.pop(0)
-                        new_el.value = elem
-                    else:
-                        # Nothing left to reuse -> create new one
-                        new_el = ExtraDatum(dkey, elem)
-
-                    # Add to the new list
-                    new_extra_data_db.append(new_el)
-
-        def merge_list_to_item(
-            dkey: str, dval: list[str], db_val: ExtraDatum
-        ) -> None:
-            """Merge a new extra data list value to an old wrapper.
-
-            Reuses the old wrapper if its value is in the new list or by
-            replacing its value with the first one in the list.
-            """
-            if db_val.value in dval:
-                # Old value is in the list -> just keep
-                dval.remove(db_val.value)
+                    missing.append((key, val))
+
+        # Rows of removed values get the new values under the same key
+        spare: collections.defaultdict[
+            str, list[ExtraDatum]
+        ] = collections.defaultdict(list)
+        for (key, _), wrappers in unmatched.items():
+            spare[key] += wrappers
+
+        for key, val in missing:
+            if wrappers := spare.get(key):
+                ext_d = wrappers.pop()
+                ext_d.value = val
             else:
-                # Old value is not present anymore -> replace with
-                # first value in the list
-                db_val.value = dval.pop(0)
-                # Add processed element to the new list
-            new_extra_data_db.append(db_val)
+                ext_d = ExtraDatum(key, val)
 
-            # Process all remaining new elements
-            for elem in dval:
-                new_extra_data_db.append(ExtraDatum(dkey, elem))
-
-        for key, value in data.items():
-            if key in extra_data_db:
-                # Merge with existing
-                match (value, extra_data_db[key]):
-                    case (list(val), list(val_db)):
-                        if len(val) == 0:
-                            continue
-
-                        merge_lists(key, val, val_db)
-
-                    case (list(val), ExtraDatum(val_db)):
-                        if len(val) == 0:
-                            continue
-
-                        merge_list_to_item(key, val, val_db)
-
-                    case (str(val), list(val_db)):
-                        val_db[0].value = val
-                        new_extra_data_db.append(val_db[0])
-                    case (str(val), ExtraDatum(val_db)):
-                        val_db.value = val
-                        new_extra_data_db.append(val_db)
-            else:
-                # Create new one, this key doesn't exist yet
-                if isinstance(value, list):
-                    for elem in value:
-                        new_extra_data_db.append(ExtraDatum(key, elem))
-                else:
-                    new_extra_data_db.append(ExtraDatum(key, value))
+            new_extra_data_db.append(ext_d)
 
         self.extra_data_db = new_extra_data_db
 
-    @Snapshot.protect
     def update(self, params: ProjectArgs) -> Project:
         """Update this instance with the provided new parameters.
 
         Valid parameters are those defined in ProjectArgs.
         """
+        # Nothing to change, skip taking a snapshot
+        if params.keys().isdisjoint(Project._UPDATE_KEYS):
+            return self
+
+        return self._update(params)
+
+    @Snapshot.protect
+    def _update(self, params: ProjectArgs) -> Project:
+        """Apply the update, rolling back on failure."""
         self._update_general(params)
         self._update_followup(params)
 
@@ -1031,7 +1296,7 @@ class AgricultureProject(Project):
     """Class representing projects developing an agricultural system."""
 
     # Definitions for the database tables #
-    __mapper_args__ = {"polymorphic_identity": "AGRICULTURE"}
+    __mapper_args__ = {"polymorphic_identity": ProjectType.AGRICULTURE.value}
 
     # End database definitions #
 
@@ -1044,7 +1309,9 @@ class ElectronicsDevelopmentProject(Project):
     """Class representing projects developing electronics."""
 
     # Definitions for the database tables #
-    __mapper_args__ = {"polymorphic_identity": "ELECTRONICS_DEVELOPMENT"}
+    __mapper_args__ = {
+        "polymorphic_identity": ProjectType.ELECTRONICS_DEVELOPMENT.value
+    }
 
     # End database definitions #
 
@@ -1065,7 +1332,7 @@ class EnergyProject(Project):
         "EnergyProjectComponent", cascade="all, delete-orphan"
     )
 
-    __mapper_args__ = {"polymorphic_identity": "ENERGY"}
+    __mapper_args__ = {"polymorphic_identity": ProjectType.ENERGY.value}
 
     # End database definitions #
 
@@ -1099,12 +1366,11 @@ class EnergyProject(Project):
 
     def __repr__(self) -> str:
         """Provide a string representation for this instance."""
-        return (
-            f"EnergyProject("
-            f"{super().__repr__()}, "
-            f"power={self.power}"
-            f")"
+        # Not loaded by list queries, do not load it just to represent it
+        power = (
+            "<unloaded>" if "power" in inspect(self).unloaded else self.power
         )
+        return f"EnergyProject({super().__repr__()}, power={power})"
 
     @staticmethod
     def is_legal_power(power: float) -> bool:
@@ -1116,7 +1382,9 @@ class EnergyProject(Project):
         component: model.EnergyProjectComponent,
     ) -> bool:
         """Check if the provided component is a legal project component."""
-        return isinstance(component, model.EnergyProjectComponent)
+        return type(component) in utils.get_subclasses(
+            model.EnergyProjectComponent
+        )
 
     # A more specific data class is ok in this case, doesn't violate LSP
     # since it has no behavior
@@ -1146,7 +1414,7 @@ class WaterProject(Project):
     """Class representing projects installing a water system."""
 
     # Definitions for the database tables #
-    __mapper_args__ = {"polymorphic_identity": "WATER"}
+    __mapper_args__ = {"polymorphic_identity": ProjectType.WATER.value}
 
     # End database definitions #
 
@@ -1159,7 +1427,9 @@ class WasteManagementProject(Project):
     """Class representing projects developing a waste management solution."""
 
     # Definitions for the database tables #
-    __mapper_args__ = {"polymorphic_identity": "WASTE_MANAGEMENT"}
+    __mapper_args__ = {
+        "polymorphic_identity": ProjectType.WASTE_MANAGEMENT.value
+    }
 
     # End database definitions #
 
@@ -1209,14 +1479,17 @@ class ProjectFactory:
                 "Component parameters must contain an entry for 'type'"
             )
 
-        try:
-            return ProjectFactory.project_components[params.pop("type")](
-                **params
+        component_type = params.pop("type")
+        if (
+            constructor := ProjectFactory.project_components.get(
+                component_type
             )
-        except KeyError as exc:
+        ) is None:
             raise exceptions.IllegalArgumentException(
-                f"Unknown project component: {str(exc)}"
-            ) from exc
+                f"Unknown project component: {component_type!r}"
+            )
+
+        return constructor(**params)
 
 
 # --------------------------
@@ -1247,30 +1520,39 @@ class ProjectCategory(Enum):
     WATER = ("water", WaterProject)
     WASTE_MANAGEMENT = ("waste management", WasteManagementProject)
 
+    def __init__(self, category_name: str, class_name: type[Project]) -> None:
+        """Unpack the definition once, instead of on every property access."""
+        self._category_name = category_name
+        self._class_name = class_name
+
     @property
     def category_name(self) -> str:
         """Provide lower case name of the category."""
-        return self.value[0]
+        return self._category_name
 
     @property
     def class_name(self) -> type[Project]:
         """Provide class corresponding to the project category."""
-        return self.value[1]
+        return self._class_name
 
     @staticmethod
     def categories() -> tuple[ProjectCategory, ...]:
         """Provide a list of all project categories."""
-        return tuple(ProjectCategory.__members__.values())
+        return _CATEGORIES
 
     @staticmethod
     def from_string(category: str) -> ProjectCategory:
         """Provide enum value representing the given string."""
-        if category not in ProjectCategory.__members__:
+        if (member := ProjectCategory.__members__.get(category)) is None:
             raise exceptions.IllegalArgumentException(
                 f"Unexpected category: {category}"
             )
 
-        return ProjectCategory.__members__[category]
+        return member
+
+
+# Members never change, so the tuple is built once
+_CATEGORIES = tuple(ProjectCategory.__members__.values())
 
 
 if __name__ == "__main__":
@@ -31,6 +31,7 @@ from sqlalchemy.ext.declarative import declared_attr
 # Local modules
 # pylint: disable=cyclic-import
 from humasol import exceptions, model
+from humasol.model import utils
 from humasol.model.snapshot import Snapshot
 
 # pylint: enable=cyclic-import
@@ -75,6 +76,11 @@ class ProjectComponent(db.Model, model.ProjectElement):
 
         self.type = self.LABEL
 
+    def __init_subclass__(cls, **kwargs: ty.Any) -> None:
+        """Invalidate cached class hierarchies when a component is defined."""
+        super().__init_subclass__(**kwargs)
+        utils.clear_subclass_cache()
+
     # Capital case attribute doesn't conform to snake-casing
     # Used here because it represents a class constant that has to be defined
     # pylint: disable=invalid-name
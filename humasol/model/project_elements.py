@@ -10,7 +10,10 @@ Address         -- Street address of a project location
 Coordinate      -- Geographical coordinates of a project location
 Location        -- Class representing a physical location as indicated on a map
 SDG             -- Enum class containing all SDG goals as defined by the UN
-SdgDb           -- Wrapper class to store SDG enum values in the database
+CachedSDGEnum   -- Database type storing SDG goals by their number
+ProjectSdg      -- Association of a project with one of its SDG goals
+ProjectRole     -- Enum class with the roles people can have in a project
+ProjectPerson   -- Association of a project with a person in a specific role
 DataSource      -- Class containing all the information to access a project's
                     logged data
 """
@@ -19,8 +22,11 @@ DataSource      -- Class containing all the information to access a project's
 from __future__ import annotations
 
 import re
+import sys
 import typing as ty
-from enum import Enum
+from enum import Enum, IntEnum
+
+from sqlalchemy.types import TypeDecorator
 
 # Local modules
 import humasol
@@ -28,6 +34,9 @@ from humasol import exceptions, model
 from humasol.model.snapshot import Snapshot
 from humasol.repository import db
 
+# Validation pattern for place, country and street names, compiled on import
+_PLACE_RE = re.compile(r"[A-Z]([A-Z\s,.]-?)*")
+
 
 # TODO: implement RSA (or other crypto method)
 def encrypt(value: str) -> str:
@@ -127,9 +136,7 @@ class Address(model.BaseModel, model.ProjectElement):
         if not isinstance(country, str):
             return False
 
-        return (
-            re.fullmatch(r"[A-Z]([A-Z\s,.]-?)*", country.upper()) is not None
-        )
+        return _PLACE_RE.fullmatch(country.upper()) is not None
 
     @staticmethod
     def is_legal_number(number: ty.Optional[int]) -> bool:
@@ -143,15 +150,14 @@ class Address(model.BaseModel, model.ProjectElement):
         if not isinstance(place, str):
             return False
 
-        return re.fullmatch(r"[A-Z]([A-Z\s,.]-?)*", place.upper()) is not None
+        return _PLACE_RE.fullmatch(place.upper()) is not None
 
     @staticmethod
     def is_legal_street(street: ty.Optional[str]) -> bool:
         """Check whether the provided street is a legal street name."""
         return street is None or (
             isinstance(street, str)
-            and re.fullmatch(r"^[A-Z]([A-Z\s,.]-?)*", street.upper())
-            is not None
+            and _PLACE_RE.fullmatch(street.upper()) is not None
         )
 
     @Snapshot.protect
@@ -386,31 +392,114 @@ class SDG(Enum):
         return self.goal_name
 
 
+# Only the conversion methods are relevant for this type
+# pylint: disable=abstract-method, too-many-ancestors
+class CachedSDGEnum(TypeDecorator):
+    """Database type storing SDG goals by their number.
+
+    Conversion in both directions goes through precomputed mappings, instead
+    of resolving the enum member by name for every row.
+    """
+
+    impl = db.SmallInteger
+    cache_ok = True
+
+    _NUMBERS = {goal: int(goal.name.removeprefix("GOAL_")) for goal in SDG}
+    _LOOKUP = {number: goal for goal, number in _NUMBERS.items()}
+
+    def process_bind_param(
+        self, value: ty.Optional[SDG], dialect: ty.Any
+    ) -> ty.Optional[int]:
+        """Convert the goal to the stored number."""
+        return None if value is None else self._NUMBERS[value]
+
+    def process_result_value(
+        self, value: ty.Optional[int], dialect: ty.Any
+    ) -> ty.Optional[SDG]:
+        """Convert the stored number back to its goal."""
+        return None if value is None else self._LOOKUP[value]
+
+
+# pylint: enable=abstract-method, too-many-ancestors
+
+
 # Disable pylint complaint. Wrapper class is needed for the database.
 # pylint: disable=too-few-public-methods
-class SdgDB(model.BaseModel):
-    """Wrapper class for the SDG enum.
+class ProjectSdg(model.BaseModel):
+    """Association between a project and one of its SDG goals.
 
-    The wrapper class is used to store the custom enum values in the database
-    and allow them to be unique while having relations to the projects.
+    Rows only hold the project identifier and the enum value, so the SDGs of a
+    project are loaded straight from the association table without joining a
+    separate lookup table.
     """
 
     # Definitions for the database tables #
-    __tablename__ = "sdg_db"
+    __tablename__ = "project_sdg"
 
-    sdg = db.Column(db.Enum(SDG), primary_key=True)
+    project_id = db.Column(
+        db.Integer,
+        db.ForeignKey("project.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    sdg = db.Column(CachedSDGEnum, primary_key=True)
 
     # End of database definitions #
 
-    def __init__(self, sdg) -> None:
-        """Instantiate wrapper.
+    def __init__(self, sdg: SDG) -> None:
+        """Instantiate association.
 
         Arguments:
-        role     -- SDG enum value
+        sdg     -- SDG enum value
         """
         self.sdg = sdg
 
 
+class ProjectRole(IntEnum):
+    """Roles a person can have in a project.
+
+    Stored as a small integer with every link between a project and a person.
+    """
+
+    STUDENT = 0
+    SUPERVISOR = 1
+    PARTNER = 2
+    CONTACT = 3
+
+
+class ProjectPerson(model.BaseModel):
+    """Association between a project and a person with a specific role.
+
+    All roles share one association table, so the whole team of a project is
+    loaded with a single query. The person is joined in with the link.
+    """
+
+    # Definitions for the database tables #
+    __tablename__ = "project_person"
+
+    project_id = db.Column(
+        db.Integer,
+        db.ForeignKey("project.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    role = db.Column(db.SmallInteger, primary_key=True)
+    person_id = db.Column(
+        db.Integer, db.ForeignKey("person.id"), primary_key=True
+    )
+    person = db.relationship("Person", lazy="joined")
+
+    # End of database definitions #
+
+    def __init__(self, person: model.Person, role: ProjectRole) -> None:
+        """Instantiate association.
+
+        Arguments:
+        person  -- Person to associate with the project
+        role    -- Role of the person in the project
+        """
+        self.person = person
+        self.role = role.value
+
+
 class ExtraDatum(db.Model):
     """Extra data wrapper for database mapping."""
 
@@ -418,13 +507,15 @@ class ExtraDatum(db.Model):
     project_id = db.Column(
         db.Integer,
         db.ForeignKey("project.id", ondelete="CASCADE"),
+        index=True,
     )
     key = db.Column(db.String, nullable=False)
     value = db.Column(db.String)
 
     def __init__(self, key: str, value: str) -> None:
         """Wrap dictionary entry."""
-        self.key = key
+        # Projects share a handful of keys, store each of them only once
+        self.key = sys.intern(key)
         self.value = value
 
     def __repr__(self) -> str:
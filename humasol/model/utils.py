@@ -11,6 +11,12 @@ from humasol import exceptions
 T = ty.TypeVar("T")
 V = ty.TypeVar("V")
 
+# Cache of class hierarchies, see get_subclasses
+_SUBCLASSES: dict[type, frozenset[type]] = {}
+
+# Cache of the guard names defined per class and attribute, see check_guards
+_GUARDS: dict[tuple[type, str], tuple[str, ...]] = {}
+
 
 def check_guards(obj: ty.Any, key: str, value: ty.Any) -> None:
     """Check all defined guards of the object for the provided key.
@@ -25,15 +31,29 @@ def check_guards(obj: ty.Any, key: str, value: ty.Any) -> None:
 
     Parameters
     __________
-    obj     -- Object on which to check the guards
+    obj     -- Object or class on which to check the guards
     key     -- Attribute for which to check the guards
     value   -- Value with which to check the guards
     """
-    for num, att in itertools.product(("is", "are"), ("legal", "valid")):
+    if key.startswith("_sa_"):
+        # SQLAlchemy bookkeeping (e.g., instance state) is never guarded
+        return
+
+    # Guards are defined on the class, look them up once per attribute.
+    # The object may also be the class itself (e.g., to check raw rows).
+    cls = obj if isinstance(obj, type) else type(obj)
+    if (guards := _GUARDS.get((cls, key))) is None:
+        guards = _GUARDS[(cls, key)] = tuple(
+            guard
+            for num, att in itertools.product(
+                ("is", "are"), ("legal", "valid")
+            )
+            if hasattr(cls, guard := f"{num}_{att}_{key}")
+        )
+
+    for guard in guards:
         try:
-            if hasattr(obj, guard := f"{num}_{att}_{key}") and not getattr(
-                obj, guard
-            )(value):
+            if not getattr(obj, guard)(value):
                 raise exceptions.IllegalArgumentException(
                     f"Illegal value for {key}."
                 )
@@ -44,13 +64,48 @@ def check_guards(obj: ty.Any, key: str, value: ty.Any) -> None:
             ...
 
 
+def clear_subclass_cache() -> None:
+    """Invalidate the class hierarchies cached by get_subclasses.
+
+    Should be called whenever a new class is defined in a cached hierarchy.
+    """
+    _SUBCLASSES.clear()
+
+
+def get_subclasses(cls: type) -> frozenset[type]:
+    """Provide the class together with all its direct and indirect subclasses.
+
+    The hierarchy is only walked on the first call for a class, after which
+    the result is cached. Membership of type(obj) in the returned set is
+    equivalent to isinstance(obj, cls) for classes without virtual
+    subclasses.
+
+    Parameters
+    __________
+    cls     -- Root class of the hierarchy
+    """
+    if (subclasses := _SUBCLASSES.get(cls)) is None:
+        found = {cls}
+        pending = [cls]
+
+        while pending:
+            for sub in pending.pop().__subclasses__():
+                if sub not in found:
+                    found.add(sub)
+                    pending.append(sub)
+
+        subclasses = _SUBCLASSES[cls] = frozenset(found)
+
+    return subclasses
+
+
 # pylint: disable=too-many-arguments
 
 
 def merge_update_list(
     old: list[T],
     new: list[dict[str, ty.Any]],
-    identifiers: list[V],
+    new_identifier: ty.Callable[[dict[str, ty.Any]], V],
     identifier_mapper: ty.Callable[[T], V],
     merge_mapper: ty.Callable[[T, dict[str, ty.Any]], T],
     constructor: ty.Callable[[dict[str, ty.Any]], T],
@@ -65,9 +120,10 @@ def merge_update_list(
     old          -- Old list of object to be updated
     new          -- New list of parameter dictionaries which should be merged
                      with the old list
-    identifiers  -- List of identifiers (of the new list) based on which the
-                     objects and parameters can be linked
+    new_identifier    -- Callable mapping the new parameter dictionaries to
+                          their identifiers (e.g., operator.itemgetter)
     identifier_mapper -- Callable mapping the old objects to their identifiers
+                          (e.g., operator.attrgetter)
     merge_mapper -- Callable used to merge the parameters with an existing
                      object
     constructor  -- Constructor callable to construct a new object instance.
@@ -75,15 +131,36 @@ def merge_update_list(
                      new parameters
     """
     # TODO: Check correctness
+    # Nothing to merge with, e.g., when a list is first filled in
+    if not old:
+        return [constructor(params) for params in new]
+
+    identifiers = [new_identifier(params) for params in new]
+
+    # Fast path: same objects in the same order, only the parameters changed
+    if len(old) == len(new) and all(
+        identifier_mapper(obj) == identifier
+        for obj, identifier in zip(old, identifiers)
+    ):
+        return [merge_mapper(obj, params) for obj, params in zip(old, new)]
+
+    # Positions of the new parameters per identifier, first one on top
+    positions: dict[V, list[int]] = {}
+    for idx in reversed(range(len(identifiers))):
+        positions.setdefault(identifiers[idx], []).append(idx)
+
+    matched = [False] * len(new)
     new_objects = []
 
     for obj in old:
-        if identifier_mapper(obj) in identifiers:
-            idx = identifiers.index(identifier_mapper(obj))
-            new_objects.append(merge_mapper(obj, new.pop(idx)))
-            identifiers.pop(idx)
-
-    new_objects += [constructor(obj) for obj in new]
+        if indices := positions.get(identifier_mapper(obj)):
+            idx = indices.pop()
+            matched[idx] = True
+            new_objects.append(merge_mapper(obj, new[idx]))
+
+    new_objects += [
+        constructor(params) for params, used in zip(new, matched) if not used
+    ]
 
     return new_objects
 
@@ -7,11 +7,13 @@ db: SQLAlchemy = SQLAlchemy()
 # Local modules
 # pylint: disable=cyclic-import
 from .storage_repository import (  # noqa
+    bulk_insert,
     commit,
     delete_project,
     expunge,
     get_object_by_attributes,
     get_object_by_id,
+    get_objects_by_values,
     merge,
     no_autoflush,
     save_project,
@@ -147,6 +147,40 @@ def _save_project_data_to_file(
         json.dump(data, data_file)
 
 
+def bulk_insert(cls: type[T], rows: list[dict[str, ty.Any]]) -> list[tuple]:
+    """Insert rows into the table of the provided class in one statement.
+
+    Bypasses the ORM unit of work, so no objects are added to the session.
+    Changes are not committed.
+
+    Parameters
+    __________
+    cls     -- Class of the objects to insert
+    rows    -- Column values of the rows to insert
+
+    Returns
+    _______
+    List with the primary key of every inserted row.
+    """
+    if not rows:
+        return []
+
+    primary_key = sqlalchemy.inspect(cls).primary_key
+
+    try:
+        # pylint: disable=no-member
+        result = db.session.execute(
+            sqlalchemy.insert(cls).values(rows).returning(*primary_key)
+        )
+        # pylint: enable=no-member
+    except sqlalchemy.exc.IntegrityError as exc:
+        raise exceptions.IntegrityException(str(exc)) from exc
+    except sqlalchemy.exc.SQLAlchemyError as exc:
+        raise exceptions.RepositoryException(str(exc)) from exc
+
+    return [tuple(row) for row in result]
+
+
 def commit() -> None:
     """Commit changes made to persisted objects."""
     try:
@@ -242,7 +276,10 @@ def get_object_by_attributes(
 
 
 def get_object_by_id(
-    obj_class: type[T], obj_id: int, eager: bool = False
+    obj_class: type[T],
+    obj_id: int,
+    eager: bool = False,
+    query: ty.Optional[sqlalchemy.orm.Query] = None,
 ) -> T:
     """Retrieve an object of the given class from the database.
 
@@ -253,9 +290,12 @@ def get_object_by_id(
     obj_class   -- Class of the object to load
     obj_id      -- ID of the object to load
     eager       -- Whether to force eager loading of relationships
+    query       -- Query to load the object with, e.g., with loader options
+                    for its relationships. Defaults to the query of the class
     """
     try:
-        query = obj_class.query
+        if query is None:
+            query = obj_class.query
 
         if eager:
             # Create orm query options to force eager loading
@@ -293,6 +333,44 @@ def get_object_by_id(
     return obj
 
 
+def get_objects_by_values(
+    cls: type[T], attribute: str, values: ty.Iterable[ty.Any]
+) -> list[T]:
+    """Retrieve all objects whose attribute matches any of the values.
+
+    Issues a single query, regardless of the number of values.
+
+    Parameters
+    __________
+    cls         -- Class of objects to query
+    attribute   -- Name of the attribute on which to match
+    values      -- Accepted values for the attribute
+
+    Returns
+    _______
+    List of objects of the provided class (cls). Can be empty if non matched.
+    """
+    if not (values := list(values)):
+        return []
+
+    try:
+        return cls.query.filter(getattr(cls, attribute).in_(values)).all()
+
+    except (AttributeError, sqlalchemy.exc.NoSuchTableError) as exc:
+        raise exceptions.NotDatamodelClassException(str(exc)) from exc
+    except (
+        sqlalchemy.exc.DBAPIError,
+        sqlalchemy.exc.DataError,
+        sqlalchemy.exc.DatabaseError,
+        sqlalchemy.exc.NoReferencedColumnError,
+    ) as exc:
+        raise exceptions.ObjectNotFoundException(str(exc)) from exc
+    except sqlalchemy.exc.InvalidRequestError as exc:
+        raise exceptions.InvalidRequestException(str(exc)) from exc
+    except sqlalchemy.exc.SQLAlchemyError as exc:
+        raise exceptions.RepositoryException(str(exc)) from exc
+
+
 def merge(obj: model.Model) -> None:
     """Merge an object with internal database state.
 
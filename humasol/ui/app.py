@@ -17,6 +17,7 @@ from flask_security import (
 )
 from flask_security import utils as sec_util
 from flask_sqlalchemy.session import Session
+from sqlalchemy import orm
 from werkzeug.local import LocalProxy
 
 # Local modules
@@ -103,12 +104,23 @@ class HumasolApp(Flask):
         self.config["SECURITY_REGISTERABLE"] = True
 
         self.config["SQLALCHEMY_DATABASE_URI"] = cf.DATABASE_URL
+        self.config["SQLALCHEMY_ENGINE_OPTIONS"] = {
+            "pool_size": cf.DB_POOL_SIZE,
+            "max_overflow": cf.DB_MAX_OVERFLOW,
+            "pool_timeout": cf.DB_POOL_TIMEOUT,
+            "pool_recycle": cf.DB_POOL_RECYCLE,
+            # Replace connections dropped by the server instead of failing
+            "pool_pre_ping": True,
+        }
 
     def _setup_db(self) -> None:
         """Set up the database connection."""
         db.init_app(self)
         self._migrate = Migrate(self, db)
 
+        # Resolve all mappers now instead of on the first query
+        orm.configure_mappers()
+
         # Create tables if they do not exist
         with self.app_context():
             if not model_ops.tables_exist():
@@ -308,7 +320,7 @@ class HumasolApp(Flask):
         _______
         Return complete project object.
         """
-        project = model_ops.get_project(project_id)
+        project = model_ops.get_project(project_id, full_graph=True)
 
         if editable and not (
             self.get_user() == project.creator
@@ -0,0 +1,75 @@
+"""Flatten project SDG association and drop the sdg_db lookup table
+
+Revision ID: 5e2c7a9d41b3
+Revises: baa72137feeb
+Create Date: 2023-06-02 14:12:47.318204
+
+"""
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "5e2c7a9d41b3"
+down_revision = "baa72137feeb"
+branch_labels = None
+depends_on = None
+
+SDG_VALUES = tuple(f"GOAL_{i}" for i in range(1, 18))
+
+
+def upgrade():
+    op.drop_constraint(
+        "project_sdg_sdg_fkey", "project_sdg", type_="foreignkey"
+    )
+    op.execute("DELETE FROM project_sdg WHERE project_id IS NULL")
+    op.execute(
+        "DELETE FROM project_sdg a USING project_sdg b "
+        "WHERE a.ctid < b.ctid "
+        "AND a.project_id = b.project_id AND a.sdg = b.sdg"
+    )
+    op.alter_column(
+        "project_sdg",
+        "project_id",
+        existing_type=sa.INTEGER(),
+        nullable=False,
+    )
+    op.alter_column(
+        "project_sdg",
+        "sdg",
+        existing_type=postgresql.ENUM(*SDG_VALUES, name="sdg"),
+        nullable=False,
+    )
+    op.create_primary_key(
+        "project_sdg_pkey", "project_sdg", ["project_id", "sdg"]
+    )
+    op.drop_table("sdg_db")
+
+
+def downgrade():
+    op.create_table(
+        "sdg_db",
+        sa.Column(
+            "sdg",
+            postgresql.ENUM(*SDG_VALUES, name="sdg", create_type=False),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("sdg", name="sdg_db_pkey"),
+    )
+    op.execute("INSERT INTO sdg_db (sdg) SELECT DISTINCT sdg FROM project_sdg")
+    op.drop_constraint("project_sdg_pkey", "project_sdg", type_="primary")
+    op.alter_column(
+        "project_sdg",
+        "sdg",
+        existing_type=postgresql.ENUM(*SDG_VALUES, name="sdg"),
+        nullable=True,
+    )
+    op.alter_column(
+        "project_sdg",
+        "project_id",
+        existing_type=sa.INTEGER(),
+        nullable=True,
+    )
+    op.create_foreign_key(
+        "project_sdg_sdg_fkey", "project_sdg", "sdg_db", ["sdg"], ["sdg"]
+    )
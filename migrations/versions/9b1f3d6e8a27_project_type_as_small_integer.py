@@ -0,0 +1,52 @@
+"""Store the project type discriminator as an indexed small integer
+
+Revision ID: 9b1f3d6e8a27
+Revises: 5e2c7a9d41b3
+Create Date: 2023-06-02 16:40:03.552817
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "9b1f3d6e8a27"
+down_revision = "5e2c7a9d41b3"
+branch_labels = None
+depends_on = None
+
+PROJECT_TYPES = (
+    ("project", 0),
+    ("AGRICULTURE", 1),
+    ("ELECTRONICS_DEVELOPMENT", 2),
+    ("ENERGY", 3),
+    ("WATER", 4),
+    ("WASTE_MANAGEMENT", 5),
+)
+
+
+def upgrade():
+    cases = " ".join(
+        f"WHEN '{name}' THEN {value}" for name, value in PROJECT_TYPES
+    )
+    op.alter_column(
+        "project",
+        "type",
+        existing_type=sa.String(length=50),
+        type_=sa.SmallInteger(),
+        postgresql_using=f"CASE type {cases} END",
+    )
+    op.create_index(op.f("ix_project_type"), "project", ["type"])
+
+
+def downgrade():
+    cases = " ".join(
+        f"WHEN {value} THEN '{name}'" for name, value in PROJECT_TYPES
+    )
+    op.drop_index(op.f("ix_project_type"), table_name="project")
+    op.alter_column(
+        "project",
+        "type",
+        existing_type=sa.SmallInteger(),
+        type_=sa.String(length=50),
+        postgresql_using=f"CASE type {cases} END",
+    )
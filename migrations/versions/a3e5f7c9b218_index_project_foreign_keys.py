@@ -0,0 +1,33 @@
+"""Index the foreign keys used to look up projects and their children
+
+Revision ID: a3e5f7c9b218
+Revises: f2b6c9d4e017
+Create Date: 2023-06-05 11:18:37.062945
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "a3e5f7c9b218"
+down_revision = "f2b6c9d4e017"
+branch_labels = None
+depends_on = None
+
+INDEXES = (
+    ("project", "creator_id"),
+    ("extra_datum", "project_id"),
+    ("subscription", "project_id"),
+    ("subscription", "subscriber_id"),
+    ("task", "project_id"),
+    ("task", "subscriber_id"),
+)
+
+
+def upgrade():
+    for table, column in INDEXES:
+        op.create_index(op.f(f"ix_{table}_{column}"), table, [column])
+
+
+def downgrade():
+    for table, column in INDEXES:
+        op.drop_index(op.f(f"ix_{table}_{column}"), table_name=table)
@@ -0,0 +1,31 @@
+"""Add composite indexes to the project person association tables
+
+Revision ID: c4a8e2f05d19
+Revises: 9b1f3d6e8a27
+Create Date: 2023-06-03 10:05:21.904113
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "c4a8e2f05d19"
+down_revision = "9b1f3d6e8a27"
+branch_labels = None
+depends_on = None
+
+INDEXES = (
+    ("ix_project_student_pid_sid", "project_student", "student_id"),
+    ("ix_project_super_pid_sid", "project_super", "supervisor_id"),
+    ("ix_project_partners_pid_pid", "project_partners", "partner_id"),
+    ("ix_project_contact_pid_cid", "project_contact", "contact_id"),
+)
+
+
+def upgrade():
+    for name, table, column in INDEXES:
+        op.create_index(name, table, ["project_id", column])
+
+
+def downgrade():
+    for name, table, _ in INDEXES:
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,41 @@
+"""Store project SDGs by their goal number
+
+Revision ID: e7d3b5a1c862
+Revises: c4a8e2f05d19
+Create Date: 2023-06-03 11:27:58.146730
+
+"""
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "e7d3b5a1c862"
+down_revision = "c4a8e2f05d19"
+branch_labels = None
+depends_on = None
+
+SDG_VALUES = tuple(f"GOAL_{i}" for i in range(1, 18))
+
+
+def upgrade():
+    op.alter_column(
+        "project_sdg",
+        "sdg",
+        existing_type=postgresql.ENUM(*SDG_VALUES, name="sdg"),
+        type_=sa.SmallInteger(),
+        postgresql_using="CAST(substring(sdg::text FROM 6) AS smallint)",
+    )
+    postgresql.ENUM(name="sdg").drop(op.get_bind())
+
+
+def downgrade():
+    sdg = postgresql.ENUM(*SDG_VALUES, name="sdg")
+    sdg.create(op.get_bind())
+    op.alter_column(
+        "project_sdg",
+        "sdg",
+        existing_type=sa.SmallInteger(),
+        type_=sdg,
+        postgresql_using="CAST('GOAL_' || sdg AS sdg)",
+    )
@@ -0,0 +1,67 @@
+"""Merge the project person association tables into project_person
+
+Revision ID: f2b6c9d4e017
+Revises: e7d3b5a1c862
+Create Date: 2023-06-04 09:42:16.530284
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "f2b6c9d4e017"
+down_revision = "e7d3b5a1c862"
+branch_labels = None
+depends_on = None
+
+# Old association table, its person column and index, and the role it held
+ASSOCIATIONS = (
+    ("project_student", "student_id", "ix_project_student_pid_sid", 0),
+    ("project_super", "supervisor_id", "ix_project_super_pid_sid", 1),
+    ("project_partners", "partner_id", "ix_project_partners_pid_pid", 2),
+    ("project_contact", "contact_id", "ix_project_contact_pid_cid", 3),
+)
+
+
+def upgrade():
+    op.create_table(
+        "project_person",
+        sa.Column("project_id", sa.Integer(), nullable=False),
+        sa.Column("role", sa.SmallInteger(), nullable=False),
+        sa.Column("person_id", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["project_id"], ["project.id"], ondelete="CASCADE"
+        ),
+        sa.ForeignKeyConstraint(["person_id"], ["person.id"]),
+        sa.PrimaryKeyConstraint("project_id", "role", "person_id"),
+    )
+
+    for table, column, index, role in ASSOCIATIONS:
+        op.execute(
+            f"INSERT INTO project_person (project_id, role, person_id) "
+            f"SELECT DISTINCT project_id, {role}, {column} FROM {table} "
+            f"WHERE project_id IS NOT NULL AND {column} IS NOT NULL"
+        )
+        op.drop_index(index, table_name=table)
+        op.drop_table(table)
+
+
+def downgrade():
+    for table, column, index, role in ASSOCIATIONS:
+        op.create_table(
+            table,
+            sa.Column("project_id", sa.Integer(), nullable=True),
+            sa.Column(column, sa.Integer(), nullable=True),
+            sa.ForeignKeyConstraint(
+                ["project_id"], ["project.id"], ondelete="CASCADE"
+            ),
+            sa.ForeignKeyConstraint([column], ["person.id"]),
+        )
+        op.create_index(index, table, ["project_id", column])
+        op.execute(
+            f"INSERT INTO {table} (project_id, {column}) "
+            f"SELECT project_id, person_id FROM project_person "
+            f"WHERE role = {role}"
+        )
+
+    op.drop_table("project_person")
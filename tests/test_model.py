@@ -13,8 +13,11 @@ if __name__ == "__main__":
     sys.path.append(project_dir)
 
 from test_followup_work import TestSuiteFollowupWork
+from test_model_ops import TestSuiteModelOps
 from test_person import TestSuitePerson
 from test_project import TestSuiteProject
+from test_project_elements import TestSuiteProjectElements
+from test_utils import TestSuiteUtils
 
 
 class TestSuiteModel(unittest.TestSuite):
@@ -24,6 +27,9 @@ class TestSuiteModel(unittest.TestSuite):
                 TestSuitePerson(),
                 TestSuiteFollowupWork(),
                 TestSuiteProject(),
+                TestSuiteProjectElements(),
+                TestSuiteUtils(),
+                TestSuiteModelOps(),
             ]
         )
 
@@ -0,0 +1,165 @@
+"""Test suite for the model_ops module."""
+
+# Python Libraries
+import unittest
+
+import mock
+import sqlalchemy
+from sqlalchemy import orm
+
+# Local modules
+if __name__ == "__main__":
+    # Add path to main project
+    import os
+    import sys
+
+    project_dir = os.path.dirname(os.path.dirname((os.path.abspath(__file__))))
+    sys.path.append(project_dir)
+import humasol
+import humasol.exceptions as exc
+from humasol import model
+from humasol import repository as repo
+from humasol.model import model_ops
+from humasol.model import person as pers
+from humasol.model import project as proj
+from humasol.model import project_elements as pe
+from humasol.repository import db
+from test_project import make_energy_project
+
+
+class TestBulkCreateProjects(unittest.TestCase):
+    def setUp(self) -> None:
+        self.rows = [
+            ({"name": "First"}, [pe.SDG.GOAL_1, pe.SDG.GOAL_4]),
+            ({"name": "Second"}, [pe.SDG.GOAL_7]),
+        ]
+
+    @mock.patch.object(model.Project, "build_bulk_rows")
+    @mock.patch("humasol.model.model_ops.repo")
+    def test_inserts(self, mock_repo, mock_build):
+        mock_build.return_value = self.rows
+        mock_repo.bulk_insert.side_effect = [[(3,), (4,)], []]
+
+        ids = model_ops.bulk_create_projects([{}, {}])
+
+        self.assertEqual([3, 4], ids)
+        mock_repo.bulk_insert.assert_has_calls(
+            [
+                mock.call(
+                    model.Project, [{"name": "First"}, {"name": "Second"}]
+                ),
+                mock.call(
+                    pe.ProjectSdg,
+                    [
+                        {"project_id": 3, "sdg": pe.SDG.GOAL_1},
+                        {"project_id": 3, "sdg": pe.SDG.GOAL_4},
+                        {"project_id": 4, "sdg": pe.SDG.GOAL_7},
+                    ],
+                ),
+            ]
+        )
+        mock_repo.commit.assert_called_once()
+
+    @mock.patch.object(model.Project, "build_bulk_rows")
+    @mock.patch("humasol.model.model_ops.repo")
+    def test_nothing_written_on_invalid_rows(self, mock_repo, mock_build):
+        mock_build.side_effect = exc.IllegalArgumentException
+
+        self.assertRaises(
+            exc.IllegalArgumentException,
+            lambda: model_ops.bulk_create_projects([{}]),
+        )
+        mock_repo.bulk_insert.assert_not_called()
+        mock_repo.commit.assert_not_called()
+
+
+class TestGetProject(unittest.TestCase):
+    """Load stored projects from an in-memory database."""
+
+    def setUp(self) -> None:
+        engine = sqlalchemy.create_engine(
+            "sqlite://",
+            connect_args={"check_same_thread": False},
+            poolclass=sqlalchemy.pool.StaticPool,
+        )
+        db.metadata.create_all(engine)
+
+        context = humasol.app.app_context()
+        context.push()
+        self.addCleanup(context.pop)
+
+        engines = mock.patch.dict(db.engines, {None: engine})
+        engines.start()
+        self.addCleanup(engines.stop)
+        self.addCleanup(db.session.remove)
+
+        project = make_energy_project()
+        # Humasol members share the one stored Humasol organization
+        humasol_org = pers.Humasol()
+        for person in (
+            *project.students,
+            *project.supervisors,
+            project.contact_person,
+        ):
+            person.organization = humasol_org
+        db.session.add(project)
+        db.session.commit()
+        self.project_id = project.id
+
+        # Start from an empty session, as a new request would
+        db.session.remove()
+
+    def test_edit_after_expunge(self):
+        project = model_ops.get_project(self.project_id, eager=True)
+        repo.expunge(project, recursive=True)
+
+        project.update(
+            {"location": {"address": {"place": "Gent", "country": "Belgium"}}}
+        )
+
+        self.assertEqual("Gent", project.location.address.place)
+
+    def test_full_graph_loaded(self):
+        # Raise on any relationship of the project that was not loaded
+        project = (
+            proj.Project.with_full_graph(proj.Project.query)
+            .options(orm.Load(proj.Project).raiseload("*", sql_only=True))
+            .get(self.project_id)
+        )
+
+        self.assertEqual(3, len(project.students))
+        self.assertEqual(1, len(project.supervisors))
+        self.assertEqual(1, len(project.partners))
+        self.assertEqual("Contact", project.contact_person.name)
+        self.assertEqual("Humasol", project.contact_person.organization.name)
+        self.assertEqual([pe.SDG.GOAL_1, pe.SDG.GOAL_4], list(project.sdgs))
+        self.assertEqual([], project.tasks)
+        self.assertEqual([], project.subscriptions)
+        self.assertIsNone(project.data_source)
+        self.assertEqual(1, project.creator.id)
+        self.assertEqual("Leuven", project.location.address.place)
+        self.assertEqual(50, project.location.coordinates.latitude)
+        self.assertEqual("Project for testing purposes", project.description)
+
+    def test_page_loads_full_graph(self):
+        project = model_ops.get_project(self.project_id, full_graph=True)
+
+        for attr in ("team_links", "sdg_links", "subscriptions", "tasks"):
+            self.assertNotIn(attr, sqlalchemy.inspect(project).unloaded)
+
+
+class TestSuiteModelOps(unittest.TestSuite):
+    def __init__(self):
+        super().__init__(
+            [
+                unittest.TestLoader().loadTestsFromTestCase(
+                    TestBulkCreateProjects
+                ),
+                unittest.TestLoader().loadTestsFromTestCase(TestGetProject),
+            ]
+        )
+
+
+if __name__ == "__main__":
+    runner = unittest.TextTestRunner()
+    runner.run(TestSuiteModelOps())
@@ -1,9 +1,12 @@
 """Test suite for the project module."""
 
 # Python Libraries
+import contextlib
 import datetime
 import unittest
 
+import mock
+
 # Local modules
 if __name__ == "__main__":
     # Add path to main project
@@ -13,6 +16,7 @@ if __name__ == "__main__":
     project_dir = os.path.dirname(os.path.dirname((os.path.abspath(__file__))))
     sys.path.append(project_dir)
 import humasol.exceptions as exc
+from humasol import model
 from humasol.model import followup_work as fw
 from humasol.model import person as pers
 from humasol.model import project as proj
@@ -56,6 +60,48 @@ def check_energy_project_attributes(tester, project):
     tester.assertEqual(tester.power, project.power)
 
 
+def make_energy_project(**kwargs):
+    params = {
+        "name": "Test project",
+        "creator": model.User(
+            id=1,
+            email="creator@humasol.be",
+            password="password",
+            fs_uniquifier="creator",
+        ),
+        "creation_date": datetime.date.today(),
+        "implementation_date": datetime.date(2021, 8, 1),
+        "description": "Project for testing purposes",
+        "location": pe.Location(
+            pe.Address("Leuven", "Belgium"), pe.Coordinates(50, 4)
+        ),
+        "work_folder": "url",
+        "students": [
+            pers.Student("S1", "s1@gmail.com", "KUL", "CS"),
+            pers.Student("S2", "s2@gmail.com", "KUL", "Elec"),
+            pers.Student("S3", "s3@gmail.com", "KUL", "Mech"),
+        ],
+        "supervisors": [
+            pers.Supervisor("Test super", "ts@humasol.be", "Test oversight")
+        ],
+        "contact_person": pers.Supervisor(
+            "Contact", "contact@humasol.be", "Contact"
+        ),
+        "partners": [
+            pers.Partner(
+                "Part",
+                "part@email.com",
+                "Project oversight",
+                pers.BelgianPartner("Test Partner", "path/logo.png"),
+            )
+        ],
+        "sdgs": [pe.SDG.GOAL_1, pe.SDG.GOAL_4],
+        "power": 10,
+    }
+
+    return proj.EnergyProject(**(params | kwargs))
+
+
 ###################
 # Mock classes
 ###################
@@ -252,12 +298,256 @@ class TestEnergyProject(unittest.TestCase):
         pass
 
 
+class TestProjectTeam(unittest.TestCase):
+    def setUp(self) -> None:
+        self.project = make_energy_project()
+
+    def test_round_trip(self):
+        students = self.project.students
+        supervisors = self.project.supervisors
+        contact = self.project.contact_person
+
+        self.project.students = students[::-1]
+
+        self.assertEqual(students[::-1], self.project.students)
+        self.assertEqual(supervisors, self.project.supervisors)
+        self.assertIs(contact, self.project.contact_person)
+        self.assertEqual(6, len(self.project.team_links))
+
+    def test_contact_also_supervisor(self):
+        sup = self.project.supervisors[0]
+        self.project.contact_person = sup
+
+        self.assertIs(sup, self.project.contact_person)
+        self.assertEqual((sup,), self.project.supervisors)
+        self.assertEqual(
+            {pe.ProjectRole.SUPERVISOR, pe.ProjectRole.CONTACT},
+            {
+                link.role
+                for link in self.project.team_links
+                if link.person is sup
+            },
+        )
+
+    def test_links_reused(self):
+        links = {
+            id(link.person): link
+            for link in self.project.team_links
+            if link.role == pe.ProjectRole.STUDENT
+        }
+        new_student = pers.Student("S4", "s4@gmail.com", "KUL", "Chem")
+
+        self.project.students = [*self.project.students[1:], new_student]
+
+        for link in self.project.team_links:
+            if link.role != pe.ProjectRole.STUDENT:
+                continue
+            if link.person is new_student:
+                self.assertNotIn(link, links.values())
+            else:
+                self.assertIs(links[id(link.person)], link)
+
+    def test_team_read_only(self):
+        new_student = pers.Student("S4", "s4@gmail.com", "KUL", "Chem")
+
+        self.assertRaises(
+            AttributeError, lambda: self.project.students.append(new_student)
+        )
+        self.assertNotIn(new_student, self.project.students)
+
+    def test_contact_updated_in_place(self):
+        contact = self.project.contact_person
+
+        self.project.update(
+            {
+                "contact_person": {
+                    "type": "supervisor",
+                    "name": "New name",
+                    "email": contact.email,
+                    "function": "Contact",
+                }
+            }
+        )
+
+        self.assertIs(contact, self.project.contact_person)
+        self.assertEqual("New name", contact.name)
+
+
+class TestExtraData(unittest.TestCase):
+    def setUp(self) -> None:
+        self.project = make_energy_project(
+            extra_data={"tags": ["a", "b"], "manager": "m"}
+        )
+
+    def _rows(self):
+        return {
+            (ext_d.key, ext_d.value): ext_d
+            for ext_d in self.project.extra_data_db
+        }
+
+    def test_rows_created(self):
+        self.assertEqual(
+            {("tags", "a"), ("tags", "b"), ("manager", "m")},
+            set(self._rows()),
+        )
+
+    def test_unchanged_rows_kept(self):
+        rows = self._rows()
+        self.project.set_extra_data({"tags": ["b", "a"], "manager": "m"})
+
+        self.assertEqual(rows, self._rows())
+
+    def test_rows_reused_within_key(self):
+        rows = self._rows()
+        self.project.set_extra_data({"tags": ["a", "c"], "manager": "m"})
+
+        new_rows = self._rows()
+        self.assertIs(rows[("tags", "a")], new_rows[("tags", "a")])
+        self.assertIs(rows[("tags", "b")], new_rows[("tags", "c")])
+        self.assertIs(rows[("manager", "m")], new_rows[("manager", "m")])
+
+    def test_rows_not_reused_across_keys(self):
+        rows = self._rows()
+        self.project.set_extra_data({"tags": ["a", "b"], "other": "m"})
+
+        new_rows = self._rows()
+        self.assertEqual(
+            {("tags", "a"), ("tags", "b"), ("other", "m")}, set(new_rows)
+        )
+        self.assertNotIn(new_rows[("other", "m")], rows.values())
+        self.assertEqual("manager", rows[("manager", "m")].key)
+
+    def test_input_copied(self):
+        data = {"tags": ["a"]}
+        self.project.set_extra_data(data)
+        data["tags"].append("b")
+
+        self.assertEqual({"tags": ["a"]}, self.project.extra_data)
+
+
+class TestIterReadonly(unittest.TestCase):
+    def setUp(self) -> None:
+        self.projects = [mock.Mock(), mock.Mock(), mock.Mock()]
+        self.query = mock.Mock()
+        self.query.yield_per.return_value = iter(self.projects)
+
+    @mock.patch("humasol.model.project.db")
+    def test_all_expunged(self, mock_db):
+        self.assertEqual(
+            self.projects, list(proj.Project.iter_readonly(self.query, 2))
+        )
+        self.query.yield_per.assert_called_once_with(2)
+        mock_db.session.expunge.assert_has_calls(
+            [mock.call(project) for project in self.projects]
+        )
+
+    @mock.patch("humasol.model.project.db")
+    def test_expunged_when_stopped_early(self, mock_db):
+        with contextlib.closing(
+            proj.Project.iter_readonly(self.query)
+        ) as projects:
+            for project in projects:
+                if project is self.projects[1]:
+                    break
+
+        mock_db.session.expunge.assert_has_calls(
+            [mock.call(self.projects[0]), mock.call(self.projects[1])]
+        )
+        self.assertEqual(2, mock_db.session.expunge.call_count)
+
+
+class TestBuildBulkRows(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.creator = model.User(
+            id=1,
+            email="creator@humasol.be",
+            password="password",
+            fs_uniquifier="creator",
+        )
+
+    def setUp(self) -> None:
+        self.row = {
+            "name": "Test project",
+            "implementation_date": datetime.date(2021, 8, 1),
+            "power": 10,
+            "category": proj.ProjectCategory.ENERGY,
+            "creator": self.creator,
+            "sdgs": [pe.SDG.GOAL_1, pe.SDG.GOAL_4],
+        }
+
+    def test_completed_row(self):
+        [(values, sdgs)] = proj.Project.build_bulk_rows([self.row])
+
+        self.assertEqual([pe.SDG.GOAL_1, pe.SDG.GOAL_4], sdgs)
+        self.assertEqual("Tp", values["code"])
+        self.assertEqual("Tp.json", values["data_file"])
+        self.assertEqual(1, values["creator_id"])
+        self.assertEqual("ENERGY", values["category"])
+        self.assertEqual(proj.ProjectType.ENERGY.value, values["type"])
+        self.assertFalse(values["save_data"])
+        self.assertNotIn("creator", values)
+        self.assertNotIn("sdgs", values)
+
+    def test_provided_code(self):
+        self.row["code"] = "CODE"
+        [(values, _)] = proj.Project.build_bulk_rows([self.row])
+
+        self.assertEqual("CODE", values["code"])
+        self.assertEqual("CODE.json", values["data_file"])
+
+    def test_row_not_mutated(self):
+        row = dict(self.row)
+        proj.Project.build_bulk_rows([self.row])
+
+        self.assertEqual(row, self.row)
+
+    def test_illegal_creator(self):
+        self.row["creator"] = "creator"
+        self.assertRaises(
+            exc.IllegalArgumentException,
+            lambda: proj.Project.build_bulk_rows([self.row]),
+        )
+
+    def test_illegal_sdgs(self):
+        self.row["sdgs"] = []
+        self.assertRaises(
+            exc.IllegalArgumentException,
+            lambda: proj.Project.build_bulk_rows([self.row]),
+        )
+
+    def test_illegal_name(self):
+        self.row["name"] = "1 project"
+        self.assertRaises(
+            exc.IllegalArgumentException,
+            lambda: proj.Project.build_bulk_rows([self.row]),
+        )
+
+    def test_illegal_category_attribute(self):
+        self.row["power"] = -1
+        self.assertRaises(
+            exc.IllegalArgumentException,
+            lambda: proj.Project.build_bulk_rows([self.row]),
+        )
+
+    def test_unknown_column(self):
+        self.row["unknown"] = 1
+        self.assertRaises(
+            exc.IllegalArgumentException,
+            lambda: proj.Project.build_bulk_rows([self.row]),
+        )
+
+
 class TestSuiteProject(unittest.TestSuite):
     def __init__(self):
         super().__init__(
             [
                 unittest.TestLoader().loadTestsFromTestCase(TestProjectInit),
                 unittest.TestLoader().loadTestsFromTestCase(TestEnergyProject),
+                unittest.TestLoader().loadTestsFromTestCase(TestProjectTeam),
+                unittest.TestLoader().loadTestsFromTestCase(TestExtraData),
+                unittest.TestLoader().loadTestsFromTestCase(TestIterReadonly),
+                unittest.TestLoader().loadTestsFromTestCase(TestBuildBulkRows),
             ]
         )
 
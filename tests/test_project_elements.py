@@ -0,0 +1,54 @@
+"""Test suite for the project_elements module."""
+
+# Python Libraries
+import unittest
+
+# Local modules
+if __name__ == "__main__":
+    # Add path to main project
+    import os
+    import sys
+
+    project_dir = os.path.dirname(os.path.dirname((os.path.abspath(__file__))))
+    sys.path.append(project_dir)
+from humasol.model import project_elements as pe
+
+
+class TestCachedSDGEnum(unittest.TestCase):
+    def setUp(self) -> None:
+        self.type = pe.CachedSDGEnum()
+
+    def test_bind_param(self):
+        self.assertEqual(1, self.type.process_bind_param(pe.SDG.GOAL_1, None))
+        self.assertEqual(
+            17, self.type.process_bind_param(pe.SDG.GOAL_17, None)
+        )
+        self.assertIsNone(self.type.process_bind_param(None, None))
+
+    def test_result_value(self):
+        self.assertIs(pe.SDG.GOAL_1, self.type.process_result_value(1, None))
+        self.assertIs(pe.SDG.GOAL_17, self.type.process_result_value(17, None))
+        self.assertIsNone(self.type.process_result_value(None, None))
+
+    def test_round_trip(self):
+        for goal in pe.SDG:
+            self.assertIs(
+                goal,
+                self.type.process_result_value(
+                    self.type.process_bind_param(goal, None), None
+                ),
+            )
+
+
+class TestSuiteProjectElements(unittest.TestSuite):
+    def __init__(self):
+        super().__init__(
+            [
+                unittest.TestLoader().loadTestsFromTestCase(TestCachedSDGEnum),
+            ]
+        )
+
+
+if __name__ == "__main__":
+    runner = unittest.TextTestRunner()
+    runner.run(TestSuiteProjectElements())
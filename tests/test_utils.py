@@ -0,0 +1,125 @@
+"""Test suite for the utils module."""
+
+# Python Libraries
+import copy
+import operator
+import unittest
+
+# Local modules
+if __name__ == "__main__":
+    # Add path to main project
+    import os
+    import sys
+
+    project_dir = os.path.dirname(os.path.dirname((os.path.abspath(__file__))))
+    sys.path.append(project_dir)
+from humasol.model import utils
+
+
+class MockItem:
+    def __init__(self, name, value):
+        self.name = name
+        self.value = value
+
+    def update(self, params):
+        self.value = params["value"]
+        return self
+
+    @staticmethod
+    def construct(params):
+        return MockItem(params["name"], params["value"])
+
+
+def merge(old, new):
+    return utils.merge_update_list(
+        old,
+        new,
+        operator.itemgetter("name"),
+        operator.attrgetter("name"),
+        MockItem.update,
+        MockItem.construct,
+    )
+
+
+class TestMergeUpdateList(unittest.TestCase):
+    def setUp(self) -> None:
+        self.a = MockItem("a", 1)
+        self.b = MockItem("b", 2)
+        self.old = [self.a, self.b]
+
+    def test_empty_old(self):
+        merged = merge([], [{"name": "a", "value": 1}])
+
+        self.assertEqual(1, len(merged))
+        self.assertEqual(("a", 1), (merged[0].name, merged[0].value))
+
+    def test_same_order(self):
+        merged = merge(
+            self.old, [{"name": "a", "value": 3}, {"name": "b", "value": 4}]
+        )
+
+        self.assertEqual([self.a, self.b], merged)
+        self.assertEqual([3, 4], [item.value for item in merged])
+
+    def test_reordered(self):
+        merged = merge(
+            self.old, [{"name": "b", "value": 4}, {"name": "a", "value": 3}]
+        )
+
+        self.assertEqual(2, len(merged))
+        self.assertEqual({self.a, self.b}, set(merged))
+        self.assertEqual((3, 4), (self.a.value, self.b.value))
+
+    def test_removed_and_added(self):
+        merged = merge(
+            self.old, [{"name": "c", "value": 5}, {"name": "b", "value": 4}]
+        )
+
+        self.assertEqual(2, len(merged))
+        self.assertIs(self.b, merged[0])
+        self.assertEqual(4, self.b.value)
+        self.assertEqual(("c", 5), (merged[1].name, merged[1].value))
+
+    def test_duplicate_identifiers(self):
+        merged = merge(
+            [self.a],
+            [{"name": "a", "value": 3}, {"name": "a", "value": 4}],
+        )
+
+        # First occurrence merges, the second one is constructed
+        self.assertEqual(2, len(merged))
+        self.assertIs(self.a, merged[0])
+        self.assertEqual(3, self.a.value)
+        self.assertIsNot(self.a, merged[1])
+        self.assertEqual(("a", 4), (merged[1].name, merged[1].value))
+
+    def test_duplicate_old_identifiers(self):
+        other_a = MockItem("a", 5)
+        merged = merge([self.a, other_a], [{"name": "a", "value": 3}])
+
+        self.assertEqual([self.a], merged)
+        self.assertEqual(3, self.a.value)
+        self.assertEqual(5, other_a.value)
+
+    def test_new_not_mutated(self):
+        new = [{"name": "c", "value": 5}, {"name": "a", "value": 3}]
+        expected = copy.deepcopy(new)
+        merge(self.old, new)
+
+        self.assertEqual(expected, new)
+
+
+class TestSuiteUtils(unittest.TestSuite):
+    def __init__(self):
+        super().__init__(
+            [
+                unittest.TestLoader().loadTestsFromTestCase(
+                    TestMergeUpdateList
+                ),
+            ]
+        )
+
+
+if __name__ == "__main__":
+    runner = unittest.TextTestRunner()
+    runner.run(TestSuiteUtils())